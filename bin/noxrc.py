@@ -160,16 +160,19 @@ def cmd_upload(args):
         files = {}
 
         if args.dir:
-            # Upload entire directory
+            # Upload entire directory as a single archive
             dir_path = Path(args.dir)
             if not dir_path.is_dir():
                 error(f"Not a directory: {args.dir}")
                 return 1
 
-            for file_path in dir_path.rglob("*"):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(dir_path)
-                    files[str(rel_path)] = file_path.read_bytes()
+            info(f"Uploading directory {args.dir}...")
+            if client.upload_files_from_dir(args.session_id, dir_path, dest=args.dest):
+                success(f"Uploaded {args.dir} to {args.dest}")
+                return 0
+            else:
+                error("Upload failed")
+                return 1
         else:
             # Upload specified files
             for file_path in args.files:
@@ -218,7 +221,8 @@ def cmd_download(args):
             extract_dir = Path(args.extract or ".")
             extract_dir.mkdir(parents=True, exist_ok=True)
 
-            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+            # Streaming mode extracts in a single sequential pass over the archive
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r|*") as tar:
                 # Use 'data' filter for Python 3.12+ to avoid deprecation warning
                 # and enhance security (restricts symlinks, devices, etc.)
                 if sys.version_info >= (3, 12):
@@ -54,8 +54,8 @@ def main():
         print(f"   ✗ Failed: {e}")
         return 1
 
-    # 5. Upload a Python script
-    print("\n5. Uploading Python Script")
+    # 5. Upload files (one batched request for all files)
+    print("\n5. Uploading Files")
     script = """#!/usr/bin/env python3
 import sys
 import os
@@ -67,9 +67,15 @@ print(f"Files in workspace:")
 for item in os.listdir('.'):
     print(f"  - {item}")
 """
+    files = {
+        "hello.py": script,
+        "data.txt": "Line 1\nLine 2\nLine 3\n",
+        "config.json": '{"name": "test", "value": 42}\n',
+        "README.md": "# Test Project\n\nThis is a test.\n",
+    }
     try:
-        client.upload_files(session_id, {"hello.py": script})
-        print("   ✓ Script uploaded")
+        client.upload_files(session_id, files)
+        print(f"   ✓ Uploaded {len(files)} files")
     except NoxRunnerError as e:
         print(f"   ✗ Failed: {e}")
         return 1
@@ -84,22 +90,8 @@ for item in os.listdir('.'):
         print(f"   ✗ Failed: {e}")
         return 1
 
-    # 7. Upload multiple files
-    print("\n7. Uploading Multiple Files")
-    files = {
-        "data.txt": "Line 1\nLine 2\nLine 3\n",
-        "config.json": '{"name": "test", "value": 42}\n',
-        "README.md": "# Test Project\n\nThis is a test.\n",
-    }
-    try:
-        client.upload_files(session_id, files)
-        print(f"   ✓ Uploaded {len(files)} files")
-    except NoxRunnerError as e:
-        print(f"   ✗ Failed: {e}")
-        return 1
-
-    # 8. List files
-    print("\n8. Listing Files")
+    # 7. List files
+    print("\n7. Listing Files")
     try:
         result = client.exec(session_id, ["ls", "-la"])
         print("   Files:")
@@ -108,8 +100,8 @@ for item in os.listdir('.'):
         print(f"   ✗ Failed: {e}")
         return 1
 
-    # 9. Read a file
-    print("\n9. Reading File Content")
+    # 8. Read a file
+    print("\n8. Reading File Content")
     try:
         result = client.exec(session_id, ["cat", "data.txt"])
         print("   Content:")
@@ -118,8 +110,8 @@ for item in os.listdir('.'):
         print(f"   ✗ Failed: {e}")
         return 1
 
-    # 10. Extend TTL
-    print("\n10. Extending TTL")
+    # 9. Extend TTL
+    print("\n9. Extending TTL")
     try:
         if client.touch(session_id):
             print("   ✓ TTL extended")
@@ -128,8 +120,8 @@ for item in os.listdir('.'):
     except NoxRunnerError as e:
         print(f"   ✗ Failed: {e}")
 
-    # 11. Download files
-    print("\n11. Downloading Files")
+    # 10. Download files
+    print("\n10. Downloading Files")
     try:
         tar_data = client.download_files(session_id)
         print(f"   ✓ Downloaded {len(tar_data)} bytes")
@@ -146,8 +138,8 @@ for item in os.listdir('.'):
         print(f"   ✗ Failed: {e}")
         return 1
 
-    # 12. Cleanup
-    print("\n12. Cleaning Up")
+    # 11. Cleanup
+    print("\n11. Cleaning Up")
     try:
         if client.delete_sandbox(session_id):
             print("   ✓ Sandbox deleted")
@@ -4,8 +4,19 @@ Base backend interface for NoxRunner sandbox execution.
 This module defines the abstract interface that all sandbox backends must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+def _exec_result_events(result: dict) -> Iterator[Tuple[str, bytes]]:
+    """Turn a buffered exec() result into the events yielded by exec_stream()."""
+    if result.get("stdout"):
+        yield ("stdout", result["stdout"].encode("utf-8"))
+    if result.get("stderr"):
+        yield ("stderr", result["stderr"].encode("utf-8"))
+    yield ("exit", str(result.get("exitCode", -1)).encode("ascii"))
 
 
 class SandboxBackend(ABC):
@@ -89,6 +100,62 @@ class SandboxBackend(ABC):
         """
         pass
 
+    def exec_stream(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = "/workspace",
+        env: Optional[Dict[str, str]] = None,
+        timeout_seconds: int = 30,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Execute a command in the sandbox, yielding its output as it is produced.
+
+        The default implementation runs :meth:`exec` and yields its buffered
+        output. Backends that can stream output should override this.
+
+        Args:
+            session_id: Session identifier
+            cmd: Command to execute (list of strings)
+            workdir: Working directory (default: '/workspace')
+            env: Environment variables (optional)
+            timeout_seconds: Command timeout in seconds (default: 30)
+
+        Returns:
+            Iterator of (channel, data) tuples, where channel is 'stdout' or
+            'stderr'. The last tuple is ('exit', exit code as ASCII bytes).
+        """
+        yield from _exec_result_events(self.exec(session_id, cmd, workdir, env, timeout_seconds))
+
+    async def exec_async(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = "/workspace",
+        env: Optional[Dict[str, str]] = None,
+        timeout_seconds: int = 30,
+    ) -> dict:
+        """
+        Asynchronously execute a command in the sandbox.
+
+        The default implementation runs :meth:`exec` in the event loop's
+        default executor so it does not block the loop.
+
+        Args:
+            session_id: Session identifier
+            cmd: Command to execute (list of strings)
+            workdir: Working directory (default: '/workspace')
+            env: Environment variables (optional)
+            timeout_seconds: Command timeout in seconds (default: 30)
+
+        Returns:
+            Dict with 'exitCode', 'stdout', 'stderr', 'durationMs'
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.exec, session_id, cmd, workdir, env, timeout_seconds
+        )
+
     @abstractmethod
     def upload_files(
         self, session_id: str, files: Dict[str, Union[str, bytes]], dest: str = "/workspace"
@@ -106,6 +173,28 @@ class SandboxBackend(ABC):
         """
         pass
 
+    def upload_directory(self, session_id: str, local_dir: Path, dest: str = "/workspace") -> bool:
+        """
+        Upload the contents of a local directory to the sandbox in one request.
+
+        The default implementation reads every file under ``local_dir`` and
+        passes them to a single :meth:`upload_files` call. Backends that can
+        stream an archive straight from disk should override this.
+
+        Args:
+            session_id: Session identifier
+            local_dir: Local directory to upload
+            dest: Destination directory (default: '/workspace')
+
+        Returns:
+            True if successful
+        """
+        files: Dict[str, Union[str, bytes]] = {}
+        for file_path in local_dir.rglob("*"):
+            if file_path.is_file():
+                files[file_path.relative_to(local_dir).as_posix()] = file_path.read_bytes()
+        return self.upload_files(session_id, files, dest)
+
     @abstractmethod
     def download_files(self, session_id: str, src: str = "/workspace") -> bytes:
         """
@@ -147,3 +236,33 @@ class SandboxBackend(ABC):
             True if sandbox is ready, False if timeout
         """
         pass
+
+    async def wait_for_pod_ready_async(
+        self, session_id: str, timeout: int = 30, interval: int = 2
+    ) -> bool:
+        """
+        Asynchronously wait for sandbox to be ready.
+
+        The default implementation runs :meth:`wait_for_pod_ready` in the event
+        loop's default executor so it does not block the loop.
+
+        Args:
+            session_id: Session identifier
+            timeout: Maximum time to wait in seconds (default: 30)
+            interval: Polling interval in seconds (default: 2)
+
+        Returns:
+            True if sandbox is ready, False if timeout
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.wait_for_pod_ready, session_id, timeout, interval
+        )
+
+    def close(self) -> None:
+        """
+        Release any resources held by the backend (e.g. pooled connections).
+
+        The default implementation does nothing.
+        """
+        pass
@@ -5,16 +5,206 @@ This backend communicates with a remote NoxRunner-compatible API via HTTP.
 The remote service may be implemented using Kubernetes, Docker, or other technologies.
 """
 
+import asyncio
+import base64
+import http.client
 import json
+import os
+import random
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Dict, List, Optional, Union
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from noxrunner.backend.base import SandboxBackend
+from noxrunner.backend.base import SandboxBackend, _exec_result_events
 from noxrunner.exceptions import NoxRunnerError, NoxRunnerHTTPError
-from noxrunner.fileops.tar_handler import TarHandler
+from noxrunner.fileops.tar_handler import TarHandler, _stream_write_mode
+
+# Number of readiness probes kept in flight by wait_for_pod_ready_async
+_READY_PROBES_IN_FLIGHT = 3
+
+# wait_for_pod_ready backs off exponentially from this delay (seconds) up to
+# the polling interval, adding up to _READY_BACKOFF_JITTER seconds of jitter
+_READY_BACKOFF_BASE = 0.1
+_READY_BACKOFF_JITTER = 0.05
+
+# Default sandbox directory for uploads and downloads, and its pre-encoded
+# query string value (equivalent to urllib.parse.urlencode's encoding)
+_DEFAULT_WORKSPACE = "/workspace"
+_DEFAULT_WORKSPACE_QUERY = urllib.parse.quote_plus(_DEFAULT_WORKSPACE)
+
+# Idle keep-alive connections kept per backend. The pool never blocks: extra
+# concurrent requests open new connections, which are closed when the pool is full.
+_POOL_MAXSIZE = min(32, (os.cpu_count() or 1) * 4)
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+# while idle. The request never reached the server, so it is safe to resend it
+# once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (http.client.BadStatusLine, ConnectionError)
+
+
+def _query_value(value: str) -> str:
+    """Encode a query string value, reusing the pre-encoded default workspace."""
+    if value == _DEFAULT_WORKSPACE:
+        return _DEFAULT_WORKSPACE_QUERY
+    return urllib.parse.quote_plus(value)
+
+
+def _read_body(response: http.client.HTTPResponse) -> Union[bytes, bytearray]:
+    """
+    Read a whole response body.
+
+    When the length is known up front (Content-Length), the body is read into a
+    preallocated bytearray, which is returned without further copying; otherwise
+    (chunked responses and empty bodies) it falls back to response.read().
+    Callers that hand the body to users must convert it to bytes.
+
+    Raises:
+        http.client.IncompleteRead: If the connection closes before the whole
+                                    Content-Length was received
+    """
+    length = response.length
+    if not length:
+        # Unknown length, or an empty body (e.g. 204): read() also marks the
+        # response finished, which readinto() is never called to do here, so
+        # the connection can be reused
+        return response.read()
+
+    body = bytearray(length)
+    view = memoryview(body)
+    received = 0
+    while received < length:
+        n = response.readinto(view[received:])
+        if not n:
+            raise http.client.IncompleteRead(bytes(view[:received]), length - received)
+        received += n
+    return body
+
+
+class _ChunkedWriter:
+    """
+    Write-only file object that sends data as an HTTP/1.1 chunked request body.
+
+    Used to stream request bodies (such as tar archives) straight onto the
+    connection instead of building them in memory first.
+    """
+
+    def __init__(self, conn: http.client.HTTPConnection):
+        self._conn = conn
+
+    def write(self, data: bytes) -> int:
+        """Send data as a single chunk."""
+        if data:
+            self._conn.send(b"%X\r\n%s\r\n" % (len(data), data))
+        return len(data)
+
+    def close(self) -> None:
+        """Send the terminating zero-length chunk."""
+        self._conn.send(b"0\r\n\r\n")
+
+
+class _ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP connections to a single host.
+
+    Idle connections are kept open (HTTP/1.1 keep-alive) and handed out to later
+    requests, so only the first request on each connection pays for the TCP
+    (and TLS) handshake.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: Optional[int],
+        timeout: int,
+        maxsize: int = _POOL_MAXSIZE,
+    ):
+        """
+        Initialize the connection pool.
+
+        Args:
+            scheme: URL scheme ("http" or "https")
+            host: Host name or address of the backend
+            port: Port of the backend (None for the scheme default)
+            timeout: Socket timeout in seconds
+            maxsize: Maximum number of idle connections kept open
+                    (default: four per CPU, at most 32)
+        """
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+        # Honor the HTTP(S)_PROXY / NO_PROXY environment like urllib does.
+        # Plain HTTP requests are sent to the proxy with absolute URLs
+        # (request_prefix); HTTPS is tunneled through it with CONNECT.
+        self.request_prefix = ""
+        self.proxy_headers: Dict[str, str] = {}
+        self._proxy: Optional[Tuple[str, Optional[int]]] = None
+        netloc = host if port is None else f"{host}:{port}"
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and not urllib.request.proxy_bypass(netloc):
+            if "://" not in proxy:
+                proxy = "http://" + proxy
+            parsed = urllib.parse.urlsplit(proxy)
+            self._proxy = (parsed.hostname or "", parsed.port)
+            if parsed.username is not None:
+                credentials = f"{urllib.parse.unquote(parsed.username)}:" + urllib.parse.unquote(
+                    parsed.password or ""
+                )
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                self.proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+            if scheme == "http":
+                self.request_prefix = f"http://{netloc}"
+
+    def get(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take a connection from the pool, opening a new one if none is idle.
+
+        Returns:
+            Tuple of (connection, reused) where reused tells whether the
+            connection has already served a previous request
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+
+        return self._connect(), False
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection to the backend, through the proxy if one is set."""
+        if self._proxy is None:
+            if self.scheme == "https":
+                return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+        proxy_host, proxy_port = self._proxy
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout)
+            conn.set_tunnel(self.host, self.port, headers=self.proxy_headers)
+            return conn
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+
+    def put(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
 
 
 class HTTPSandboxBackend(SandboxBackend):
@@ -26,49 +216,121 @@ class HTTPSandboxBackend(SandboxBackend):
 
     This backend acts as an HTTP client and does not implement the sandbox itself.
     It connects to a remote service that provides the actual sandbox implementation.
+
+    Connections are kept alive and reused across requests; call :meth:`close`
+    to release them when the backend is no longer needed. The backend is
+    thread-safe: concurrent requests each use their own pooled connection.
     """
 
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30, compression: Optional[str] = None):
         """
         Initialize the HTTP backend.
 
         Args:
             base_url: Base URL of the NoxRunner backend (e.g., "http://127.0.0.1:8080")
             timeout: Request timeout in seconds (default: 30)
+            compression: Compression for uploaded tar archives: None for a plain
+                        tar (default), "gzip", or "zstd" (Python 3.14+)
+
+        Raises:
+            ValueError: If base_url is not an http(s) URL or the compression is
+                        not supported
         """
+        # Fail here rather than mid-request on the first upload
+        _stream_write_mode(compression)
+
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.compression = compression
         self.tar_handler = TarHandler()
 
+        parsed = urllib.parse.urlsplit(self.base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"base_url must be an http:// or https:// URL, got: {base_url}")
+        self._path_prefix = parsed.path
+        self._pool = _ConnectionPool(parsed.scheme, parsed.hostname, parsed.port, timeout)
+
+        # Cleared once the backend answers 404 for the readiness or streaming
+        # exec endpoint, respectively
+        self._ready_endpoint_supported = True
+        self._exec_stream_supported = True
+
+    def close(self) -> None:
+        """Close all pooled connections to the backend."""
+        self._pool.close()
+
     def _request(
         self,
         method: str,
         path: str,
-        data: Optional[Union[dict, bytes]] = None,
+        data: Optional[Union[dict, bytes, Callable[[BinaryIO], None]]] = None,
         headers: Optional[Dict[str, str]] = None,
         content_type: Optional[str] = None,
-    ) -> tuple[int, bytes]:
+    ) -> Tuple[int, Union[bytes, bytearray]]:
         """
         Make an HTTP request.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             path: API path (e.g., "/v1/sandboxes/{id}")
-            data: Request data (dict for JSON, bytes for binary)
+            data: Request data (dict for JSON, bytes for binary, or a callable that
+                  writes the body to the file object it is given; such bodies are
+                  streamed with chunked transfer encoding). A callable may be
+                  invoked again if the request has to be resent.
             headers: Additional headers
             content_type: Content-Type header
 
         Returns:
-            Tuple of (status_code, response_body)
+            Tuple of (status_code, response_body); the body may be a bytearray
 
         Raises:
             NoxRunnerHTTPError: If HTTP request fails
             NoxRunnerError: If network or other error occurs
         """
-        url = f"{self.base_url}{path}"
+        conn, response = self._send(method, path, data, headers, content_type)
+        try:
+            response_body = _read_body(response)
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise NoxRunnerError(f"Network error: {e}")
+        except Exception as e:
+            conn.close()
+            raise NoxRunnerError(f"Unexpected error: {e}")
+        self._release(conn, response)
+
+        if response.status >= 400:
+            raise NoxRunnerHTTPError(
+                response.status, response.reason, response_body.decode("utf-8", errors="ignore")
+            )
+        return response.status, response_body
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[dict, bytes, Callable[[BinaryIO], None]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None,
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send an HTTP request on a pooled connection and wait for the response headers.
+
+        The caller must read the response body and then hand the connection to
+        :meth:`_release` (or close it). Arguments are as for :meth:`_request`.
+
+        Returns:
+            Tuple of (connection, response)
+
+        Raises:
+            NoxRunnerError: If network or other error occurs
+        """
+        url = f"{self._pool.request_prefix}{self._path_prefix}{path}"
 
         # Prepare headers
         req_headers = {}
+        if self._pool.request_prefix:
+            # Plain HTTP through a proxy: the proxy sees every request
+            req_headers.update(self._pool.proxy_headers)
         if headers:
             req_headers.update(headers)
 
@@ -83,27 +345,58 @@ class HTTPSandboxBackend(SandboxBackend):
                 # Binary data
                 req_data = data
                 req_headers["Content-Type"] = content_type or "application/octet-stream"
+            else:
+                # Streamed body
+                req_headers["Content-Type"] = content_type or "application/octet-stream"
 
-        # Create request
-        req = urllib.request.Request(url, data=req_data, headers=req_headers, method=method)
-
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                status_code = response.getcode()
-                response_body = response.read()
-                return status_code, response_body
-        except urllib.error.HTTPError as e:
-            # Read error response body
-            error_body = b""
+        while True:
+            conn, reused = self._pool.get()
             try:
-                error_body = e.read()
-            except Exception:
-                pass
-            raise NoxRunnerHTTPError(e.code, str(e), error_body.decode("utf-8", errors="ignore"))
-        except urllib.error.URLError as e:
-            raise NoxRunnerError(f"Network error: {e}")
-        except Exception as e:
-            raise NoxRunnerError(f"Unexpected error: {e}")
+                if callable(data):
+                    self._send_streaming(conn, method, url, data, req_headers)
+                else:
+                    conn.request(method, url, body=req_data, headers=req_headers)
+                return conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused:
+                    # Idle keep-alive connection was dropped by the server, retry on a new one
+                    continue
+                raise NoxRunnerError(f"Network error: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise NoxRunnerError(f"Network error: {e}")
+            except Exception as e:
+                conn.close()
+                raise NoxRunnerError(f"Unexpected error: {e}")
+
+    def _release(
+        self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        """Return a connection whose response was fully read to the pool."""
+        if response.will_close:
+            conn.close()
+        else:
+            self._pool.put(conn)
+
+    def _send_streaming(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        url: str,
+        write_body: Callable[[BinaryIO], None],
+        headers: Dict[str, str],
+    ) -> None:
+        """Send a request whose body is produced by write_body, using chunked encoding."""
+        conn.putrequest(method, url)
+        for name, value in headers.items():
+            conn.putheader(name, value)
+        conn.putheader("Transfer-Encoding", "chunked")
+        conn.endheaders()
+
+        writer = _ChunkedWriter(conn)
+        write_body(writer)
+        writer.close()
 
     def _json_request(self, method: str, path: str, data: Optional[dict] = None) -> dict:
         """
@@ -131,8 +424,10 @@ class HTTPSandboxBackend(SandboxBackend):
             return {}
 
         try:
-            return json.loads(response_body.decode("utf-8"))
-        except json.JSONDecodeError as e:
+            # json.loads detects the UTF encoding of bytes itself, no decoded copy needed
+            return json.loads(response_body)
+        except ValueError as e:
+            # JSONDecodeError or UnicodeDecodeError
             raise NoxRunnerError(f"Invalid JSON response: {e}")
 
     def health_check(self) -> bool:
@@ -184,24 +479,120 @@ class HTTPSandboxBackend(SandboxBackend):
         timeout_seconds: int = 30,
     ) -> dict:
         """Execute a command in the sandbox."""
+        data = self._exec_data(cmd, workdir, env, timeout_seconds)
+        return self._json_request("POST", f"/v1/sandboxes/{session_id}/exec", data)
+
+    def exec_stream(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = "/workspace",
+        env: Optional[Dict[str, str]] = None,
+        timeout_seconds: int = 30,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Execute a command in the sandbox, yielding its output as it is produced.
+
+        Events are read one line at a time from the newline-delimited JSON
+        response of the streaming exec endpoint, so output is never buffered
+        as a whole. Backends that answer 404 for that endpoint fall back to a
+        buffered :meth:`exec`.
+        """
+        if not self._exec_stream_supported:
+            yield from super().exec_stream(session_id, cmd, workdir, env, timeout_seconds)
+            return
+
+        data = self._exec_data(cmd, workdir, env, timeout_seconds)
+        conn, response = self._send("POST", f"/v1/sandboxes/{session_id}/exec/stream", data)
+
+        if response.status >= 400:
+            try:
+                body = _read_body(response)
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                body = b""
+            else:
+                self._release(conn, response)
+            if response.status != 404:
+                raise NoxRunnerHTTPError(
+                    response.status, response.reason, body.decode("utf-8", errors="ignore")
+                )
+            # Streaming not implemented by the backend; exec() still raises if
+            # the sandbox itself does not exist
+            result = self.exec(session_id, cmd, workdir, env, timeout_seconds)
+            self._exec_stream_supported = False
+            yield from _exec_result_events(result)
+            return
+
+        exit_code = None
+        try:
+            for line in response:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if "exitCode" in event:
+                    exit_code = event["exitCode"]
+                    # Consume the end of the body so the connection can be reused
+                    response.read()
+                    break
+                yield (event["stream"], event["data"].encode("utf-8"))
+        except (OSError, http.client.HTTPException) as e:
+            raise NoxRunnerError(f"Network error: {e}")
+        except (ValueError, KeyError) as e:
+            raise NoxRunnerError(f"Invalid JSON response: {e}")
+        finally:
+            if exit_code is None:
+                # Abandoned or failed mid-stream, the connection cannot be reused
+                conn.close()
+            else:
+                self._release(conn, response)
+
+        if exit_code is None:
+            raise NoxRunnerError("Network error: exec stream ended without an exit code")
+        yield ("exit", str(exit_code).encode("ascii"))
+
+    @staticmethod
+    def _exec_data(
+        cmd: List[str], workdir: str, env: Optional[Dict[str, str]], timeout_seconds: int
+    ) -> dict:
+        """Build the JSON body of an exec request."""
         data = {"cmd": cmd, "workdir": workdir, "timeoutSeconds": timeout_seconds}
         if env:
             data["env"] = env
-
-        return self._json_request("POST", f"/v1/sandboxes/{session_id}/exec", data)
+        return data
 
     def upload_files(
         self, session_id: str, files: Dict[str, Union[str, bytes]], dest: str = "/workspace"
     ) -> bool:
         """Upload files to the sandbox."""
-        # Use TarHandler to create tar archive
-        tar_data = self.tar_handler.create_tar(files)
 
-        # Upload
-        path = f"/v1/sandboxes/{session_id}/files/upload?{urllib.parse.urlencode({'dest': dest})}"
+        def write_archive(fileobj: BinaryIO) -> None:
+            # Stream the tar archive straight into the request body
+            self.tar_handler.write_tar(files, fileobj, self.compression)
+
+        return self._upload_archive(session_id, write_archive, dest)
+
+    def upload_directory(self, session_id: str, local_dir: Path, dest: str = "/workspace") -> bool:
+        """Upload a local directory to the sandbox, streaming it from disk."""
+
+        # Symlinked files are uploaded by content, like the base implementation:
+        # host links are often absolute and would dangle inside the sandbox
+        def write_archive(fileobj: BinaryIO) -> None:
+            self.tar_handler.write_tar_from_directory(
+                local_dir, local_dir, fileobj, self.compression, follow_symlinks=True
+            )
+
+        return self._upload_archive(session_id, write_archive, dest)
+
+    def _upload_archive(
+        self, session_id: str, write_archive: Callable[[BinaryIO], None], dest: str
+    ) -> bool:
+        """POST a tar archive produced by write_archive to the upload endpoint."""
+        headers = {"Content-Encoding": self.compression} if self.compression else None
+        path = f"/v1/sandboxes/{session_id}/files/upload?dest={_query_value(dest)}"
         try:
             status_code, _ = self._request(
-                "POST", path, data=tar_data, content_type="application/x-tar"
+                "POST", path, data=write_archive, headers=headers, content_type="application/x-tar"
             )
             return status_code == 200
         except NoxRunnerHTTPError as e:
@@ -211,13 +602,14 @@ class HTTPSandboxBackend(SandboxBackend):
 
     def download_files(self, session_id: str, src: str = "/workspace") -> bytes:
         """Download files from the sandbox as a tar archive."""
-        path = f"/v1/sandboxes/{session_id}/files/download?{urllib.parse.urlencode({'src': src})}"
+        path = f"/v1/sandboxes/{session_id}/files/download?src={_query_value(src)}"
         status_code, response_body = self._request("GET", path)
 
         if not (200 <= status_code < 300):
             raise NoxRunnerHTTPError(status_code, "Download failed")
 
-        return response_body
+        # The pooled read may produce a bytearray; the public API returns bytes
+        return bytes(response_body)
 
     def delete_sandbox(self, session_id: str) -> bool:
         """Delete a sandbox."""
@@ -229,19 +621,115 @@ class HTTPSandboxBackend(SandboxBackend):
                 return True
             raise
 
+    def _probe_ready(self, session_id: str) -> bool:
+        """
+        Run a single readiness probe against the sandbox.
+
+        Uses the lightweight readiness endpoint (GET /v1/sandboxes/{id}/ready).
+        Backends that answer 404 do not implement it; for those, readiness is
+        probed by executing ``echo ready`` in the sandbox instead.
+
+        Raises:
+            NoxRunnerError: If the backend cannot be reached
+        """
+        if self._ready_endpoint_supported:
+            try:
+                status_code, _ = self._request("GET", f"/v1/sandboxes/{session_id}/ready")
+                return status_code == 200
+            except NoxRunnerHTTPError as e:
+                if e.status_code != 404:
+                    # Sandbox not ready yet (503) or transient failure
+                    return False
+                self._ready_endpoint_supported = False
+
+        try:
+            result = self.exec(session_id, ["echo", "ready"], timeout_seconds=5)
+            return result.get("stdout", "").strip() == "ready"
+        except NoxRunnerHTTPError:
+            # Sandbox might not be ready yet
+            return False
+
     def wait_for_pod_ready(self, session_id: str, timeout: int = 30, interval: int = 2) -> bool:
-        """Wait for sandbox to be ready."""
-        start_time = time.time()
+        """
+        Wait for sandbox to be ready.
+
+        Probes start 100ms apart and back off exponentially (with jitter) up to
+        interval, so a sandbox that becomes ready quickly is detected quickly.
+        While the backend is unreachable, probes are spaced a full interval apart.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
-                result = self.exec(session_id, ["echo", "ready"], timeout_seconds=5)
-                if result.get("stdout", "").strip() == "ready":
+                if self._probe_ready(session_id):
                     return True
-            except Exception:
-                # Sandbox might not be ready yet, continue polling
-                pass
+                delay = min(interval, _READY_BACKOFF_BASE * 2**attempt)
+                if delay < interval:
+                    attempt += 1
+            except NoxRunnerError:
+                # Backend unreachable, no point in probing more often
+                delay = interval
 
-            time.sleep(interval)
+            delay += random.uniform(0, _READY_BACKOFF_JITTER)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
 
         return False
+
+    async def wait_for_pod_ready_async(
+        self, session_id: str, timeout: int = 30, interval: int = 2
+    ) -> bool:
+        """
+        Asynchronously wait for sandbox to be ready.
+
+        Starts a new probe every interval/3 seconds, keeping up to three probes
+        in flight on worker threads, and returns as soon as any of them succeeds.
+        Overlapping probes detect readiness sooner than sequential polling,
+        where each probe's round trip is followed by a full interval of sleep.
+        While the backend is unreachable, single probes are spaced a full
+        interval apart, as in :meth:`wait_for_pod_ready`.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        stagger = interval / _READY_PROBES_IN_FLIGHT
+        next_probe = loop.time()
+        pending: set = set()
+        # Set while the last completed probes failed to reach the backend
+        unreachable = False
+
+        try:
+            while True:
+                now = loop.time()
+                if now >= deadline:
+                    return False
+                max_in_flight = 1 if unreachable else _READY_PROBES_IN_FLIGHT
+                if now >= next_probe and len(pending) < max_in_flight:
+                    pending.add(loop.run_in_executor(None, self._probe_ready, session_id))
+                    next_probe = now + stagger
+
+                # Wake up for the next probe start, or only on completion when saturated
+                wake_at = deadline
+                if len(pending) < max_in_flight:
+                    wake_at = min(next_probe, deadline)
+                wait_for = max(0.0, wake_at - now)
+                if not pending:
+                    await asyncio.sleep(wait_for)
+                    continue
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+                if any(not probe.exception() and probe.result() for probe in done):
+                    return True
+                if done:
+                    reached = any(not probe.exception() for probe in done)
+                    if not reached:
+                        # Backend unreachable, no point in probing more often
+                        next_probe = (
+                            loop.time() + interval + random.uniform(0, _READY_BACKOFF_JITTER)
+                        )
+                    unreachable = not reached
+        finally:
+            # Probes already running cannot be interrupted; their results are discarded
+            for probe in pending:
+                probe.cancel()
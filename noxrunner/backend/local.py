@@ -5,20 +5,73 @@ WARNING: This backend executes commands in the local environment.
 Use with extreme caution as it can cause data loss or security risks.
 """
 
+import asyncio
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Deque, Dict, List, Optional, Tuple, Union
 
 from noxrunner.backend.base import SandboxBackend
 from noxrunner.fileops.tar_handler import TarHandler
 from noxrunner.security.command_validator import CommandValidator
 from noxrunner.security.path_sanitizer import PathSanitizer
 
+# Characters stripped from session IDs to build sandbox directory names.
+# In str patterns \w matches exactly the characters for which str.isalnum()
+# is true, plus "_".
+_UNSAFE_ID_RE = re.compile(r"[^\w-]+")
+# The same set for ASCII IDs, as bytes to delete with bytes.translate(),
+# which is about twice as fast as the regex substitution
+_UNSAFE_ASCII_ID_BYTES = bytes(c for c in range(128) if not (chr(c).isalnum() or chr(c) in "_-"))
+
+
+@dataclass
+class _SandboxRec:
+    """Bookkeeping for a local sandbox."""
+
+    # Declared by hand rather than with dataclass(slots=True) (Python 3.10+)
+    __slots__ = ("path", "resolved_path", "created_at", "expires_at", "ttl_seconds")
+
+    path: Path
+    # path.resolve(), computed once at creation: the directory never moves
+    resolved_path: Path
+    # Epoch seconds (time.time()); converted to datetime only for responses
+    created_at: float
+    expires_at: float
+    ttl_seconds: int
+
+
+# Flags for _write_file(); O_CLOEXEC and O_BINARY exist only on POSIX and
+# Windows respectively
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write data to path with raw os.write() calls, bypassing file objects."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured output like subprocess text mode (universal newlines)."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
 
 class LocalBackend(SandboxBackend):
     """
@@ -37,13 +90,22 @@ class LocalBackend(SandboxBackend):
             base_dir: Base directory for sandbox storage (default: /tmp)
         """
         self.base_dir = Path(base_dir)
-        self._sandboxes: Dict[str, Dict] = {}  # session_id -> sandbox info
+        self._sandboxes: Dict[str, _SandboxRec] = {}  # session_id -> sandbox info
 
         # Initialize security and file operation utilities
         self.validator = CommandValidator()
         self.sanitizer = PathSanitizer()
         self.tar_handler = TarHandler()
 
+        # Set once the exec warning has been printed
+        self._warned_exec = False
+
+        # Deleted sandboxes are renamed into base_dir/noxrunner_gc and removed
+        # by a background thread that runs while removals are pending
+        self._gc_pending: Deque[Path] = deque()
+        self._gc_lock = threading.Lock()
+        self._gc_thread: Optional[threading.Thread] = None
+
         # Print warning on initialization
         self._print_warning(
             "Local sandbox mode is enabled. This executes commands in your local environment.",
@@ -56,19 +118,23 @@ class LocalBackend(SandboxBackend):
         if critical:
             warning_prefix = "\033[91m\033[1m🚨 CRITICAL WARNING\033[0m\033[91m"
 
-        # Print with clear formatting
-        print("", file=sys.stderr)  # Empty line for visibility
-        print(f"{warning_prefix}: {message}\033[0m", file=sys.stderr)
+        # Surrounded by empty lines for visibility, written in a single call
+        text = f"\n{warning_prefix}: {message}\033[0m\n"
         if critical:
-            print(f"\033[91m\033[1m{critical}\033[0m", file=sys.stderr)
-        print("", file=sys.stderr)  # Empty line for visibility
+            text += f"\033[91m\033[1m{critical}\033[0m\n"
+        sys.stderr.write(text + "\n")
+        sys.stderr.flush()
 
     def _get_sandbox_path(self, session_id: str) -> Path:
         """Get the sandbox directory path for a session."""
         # Sanitize session_id to prevent path traversal
-        safe_id = "".join(c for c in session_id if c.isalnum() or c in ("-", "_"))
-        if not safe_id:
-            safe_id = "default"
+        if session_id.isascii():
+            safe_id = (
+                session_id.encode("ascii").translate(None, _UNSAFE_ASCII_ID_BYTES).decode("ascii")
+            )
+        else:
+            safe_id = _UNSAFE_ID_RE.sub("", session_id)
+        safe_id = safe_id or "default"
         return self.base_dir / f"noxrunner_sandbox_{safe_id}"
 
     def _ensure_sandbox(self, session_id: str) -> Path:
@@ -109,28 +175,36 @@ class LocalBackend(SandboxBackend):
         Returns:
             Dict with 'podName' and 'expiresAt'
         """
-        sandbox_path = self._ensure_sandbox(session_id)
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        sandbox = self._create_record(session_id, ttl_seconds)
+        expires_at = datetime.fromtimestamp(sandbox.expires_at, tz=timezone.utc)
+        return {"podName": f"local-{session_id}", "expiresAt": expires_at.isoformat() + "Z"}
 
-        self._sandboxes[session_id] = {
-            "path": sandbox_path,
-            "created_at": datetime.now(timezone.utc),
-            "expires_at": expires_at,
-            "ttl_seconds": ttl_seconds,
-        }
+    def _create_record(self, session_id: str, ttl_seconds: int = 900) -> _SandboxRec:
+        """Ensure the sandbox directory exists and (re)register its record."""
+        sandbox_path = self._ensure_sandbox(session_id)
+        now = time.time()
+        sandbox = _SandboxRec(
+            sandbox_path, sandbox_path.resolve(), now, now + ttl_seconds, ttl_seconds
+        )
+        self._sandboxes[session_id] = sandbox
+        return sandbox
 
-        return {"podName": f"local-{session_id}", "expiresAt": expires_at.isoformat() + "Z"}
+    def _get_or_create(self, session_id: str) -> _SandboxRec:
+        """Return the record for a sandbox, creating the sandbox on first use."""
+        sandbox = self._sandboxes.get(session_id)
+        if sandbox is None:
+            sandbox = self._create_record(session_id)
+        return sandbox
 
     def touch(self, session_id: str) -> bool:
         """Extend the TTL of a sandbox."""
-        if session_id not in self._sandboxes:
+        sandbox = self._sandboxes.get(session_id)
+        if sandbox is None:
             # Create if doesn't exist
-            self.create_sandbox(session_id)
+            self._create_record(session_id)
             return True
 
-        sandbox = self._sandboxes[session_id]
-        ttl = sandbox.get("ttl_seconds", 900)
-        sandbox["expires_at"] = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        sandbox.expires_at = time.time() + sandbox.ttl_seconds
         return True
 
     def exec(
@@ -146,18 +220,125 @@ class LocalBackend(SandboxBackend):
 
         WARNING: This executes commands in the local environment!
         """
-        # Print warning for every exec
-        self._print_warning(
-            f"Executing command in LOCAL environment: {' '.join(cmd)}",
-            "⚠️  This may cause DATA LOSS or SECURITY RISKS! ⚠️",
+        prepared = self._prepare_exec(session_id, cmd, workdir, env)
+        if isinstance(prepared, dict):
+            return prepared
+        workdir_path, exec_env = prepared
+
+        start_time = time.time()
+
+        # Execute command with timeout
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout_seconds,
+                env=exec_env,
+                # Only the child runs in workdir; the process-wide cwd is left
+                # untouched so concurrent exec() calls don't interfere
+                cwd=str(workdir_path),
+                # Security: Don't allow shell injection
+                shell=False,
+            )
+            exit_code = result.returncode
+            stdout = result.stdout
+            stderr = result.stderr
+        except subprocess.TimeoutExpired:
+            exit_code = 124  # Standard timeout exit code
+            stdout = ""
+            stderr = f"Command timed out after {timeout_seconds} seconds"
+        except FileNotFoundError:
+            exit_code = 127  # Command not found
+            stdout = ""
+            stderr = f"Command not found: {cmd[0]}"
+        except Exception as e:
+            exit_code = 1
+            stdout = ""
+            stderr = f"Execution error: {str(e)}"
+
+        return self._exec_result(exit_code, stdout, stderr, start_time)
+
+    async def exec_async(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = "/workspace",
+        env: Optional[Dict[str, str]] = None,
+        timeout_seconds: int = 30,
+    ) -> dict:
+        """
+        Asynchronously execute a command in the sandbox.
+
+        The command runs as an asyncio subprocess, so concurrent calls are
+        multiplexed on the event loop instead of each occupying a thread.
+
+        WARNING: This executes commands in the local environment!
+        """
+        prepared = self._prepare_exec(session_id, cmd, workdir, env)
+        if isinstance(prepared, dict):
+            return prepared
+        workdir_path, exec_env = prepared
+
+        start_time = time.time()
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=exec_env,
+                cwd=str(workdir_path),
+            )
+        except FileNotFoundError:
+            return self._exec_result(127, "", f"Command not found: {cmd[0]}", start_time)
+        except Exception as e:
+            return self._exec_result(1, "", f"Execution error: {str(e)}", start_time)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout_seconds)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return self._exec_result(
+                124, "", f"Command timed out after {timeout_seconds} seconds", start_time
+            )
+        except BaseException:
+            # Cancelled (or interrupted) while waiting: don't leave the child
+            # running and unreaped
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass  # Exited on its own, still to be reaped
+                await proc.wait()
+            raise
+
+        return self._exec_result(
+            proc.returncode, _decode_output(stdout), _decode_output(stderr), start_time
         )
 
-        if session_id not in self._sandboxes:
-            # Auto-create sandbox if doesn't exist
-            self.create_sandbox(session_id)
+    def _prepare_exec(
+        self, session_id: str, cmd: List[str], workdir: str, env: Optional[Dict[str, str]]
+    ) -> Union[dict, Tuple[Path, Dict[str, str]]]:
+        """
+        Validate a command and prepare its working directory and environment.
 
-        sandbox = self._sandboxes[session_id]
-        sandbox_path = sandbox["path"]
+        Returns:
+            Tuple of (workdir path, environment), or the exec result to return
+            if the command is not allowed
+        """
+        # Print a warning on the first exec; repeating it for every command
+        # would cost more than running a trivial command
+        if not self._warned_exec:
+            self._warned_exec = True
+            self._print_warning(
+                f"Executing command in LOCAL environment: {' '.join(cmd)}",
+                "⚠️  This may cause DATA LOSS or SECURITY RISKS! ⚠️",
+            )
+
+        # Auto-create sandbox if doesn't exist
+        sandbox = self._get_or_create(session_id)
 
         # Validate command using CommandValidator
         if not self.validator.validate(cmd):
@@ -169,7 +350,9 @@ class LocalBackend(SandboxBackend):
             }
 
         # Sanitize workdir using PathSanitizer
-        workdir_path = self.sanitizer.sanitize(workdir, sandbox_path)
+        workdir_path = self.sanitizer.sanitize(
+            workdir, sandbox.path, sandbox_resolved=sandbox.resolved_path
+        )
         workdir_path.mkdir(parents=True, exist_ok=True)
 
         # Prepare environment
@@ -177,62 +360,27 @@ class LocalBackend(SandboxBackend):
         if env:
             exec_env.update(env)
 
-        # Change to sandbox workspace for safety
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(str(workdir_path))
-
-            start_time = time.time()
+        return workdir_path, exec_env
 
-            # Execute command with timeout
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout_seconds,
-                    env=exec_env,
-                    cwd=str(workdir_path),
-                    # Security: Don't allow shell injection
-                    shell=False,
-                )
-                exit_code = result.returncode
-                stdout = result.stdout
-                stderr = result.stderr
-            except subprocess.TimeoutExpired:
-                exit_code = 124  # Standard timeout exit code
-                stdout = ""
-                stderr = f"Command timed out after {timeout_seconds} seconds"
-            except FileNotFoundError:
-                exit_code = 127  # Command not found
-                stdout = ""
-                stderr = f"Command not found: {cmd[0]}"
-            except Exception as e:
-                exit_code = 1
-                stdout = ""
-                stderr = f"Execution error: {str(e)}"
-
-            duration_ms = int((time.time() - start_time) * 1000)
+    def _exec_result(self, exit_code: int, stdout: str, stderr: str, start_time: float) -> dict:
+        """Build the exec result dict."""
+        duration_ms = int((time.time() - start_time) * 1000)
 
-            return {
-                "exitCode": exit_code,
-                "stdout": stdout,
-                "stderr": stderr,
-                "durationMs": duration_ms,
-            }
-        finally:
-            os.chdir(original_cwd)
+        return {
+            "exitCode": exit_code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "durationMs": duration_ms,
+        }
 
     def upload_files(
         self, session_id: str, files: Dict[str, Union[str, bytes]], dest: str = "/workspace"
     ) -> bool:
         """Upload files to the sandbox."""
-        if session_id not in self._sandboxes:
-            self.create_sandbox(session_id)
-
-        sandbox = self._sandboxes[session_id]
-        sandbox_path = sandbox["path"]
-        dest_path = self.sanitizer.sanitize(dest, sandbox_path)
+        sandbox = self._get_or_create(session_id)
+        dest_path = self.sanitizer.sanitize(
+            dest, sandbox.path, sandbox_resolved=sandbox.resolved_path
+        )
         dest_path.mkdir(parents=True, exist_ok=True)
 
         for filepath, content in files.items():
@@ -242,7 +390,7 @@ class LocalBackend(SandboxBackend):
                 # Path contains directory separators, sanitize as relative path
                 # Remove any leading slashes and path traversal attempts
                 clean_path = filepath.lstrip("/").replace("\\", "/")
-                if ".." in clean_path or clean_path.startswith("/"):
+                if self.sanitizer.has_traversal(clean_path) or clean_path.startswith("/"):
                     # Path traversal detected, use filename only
                     safe_path = Path(self.sanitizer.sanitize_filename(filepath))
                 else:
@@ -257,51 +405,103 @@ class LocalBackend(SandboxBackend):
             target.parent.mkdir(parents=True, exist_ok=True)
 
             # Write file
-            if isinstance(content, str):
-                target.write_text(content, encoding="utf-8")
-            else:
-                target.write_bytes(content)
+            _write_file(target, content.encode("utf-8") if isinstance(content, str) else content)
 
         return True
 
-    def download_files(self, session_id: str, src: str = "/workspace") -> bytes:
-        """Download files from the sandbox as a tar archive."""
-        if session_id not in self._sandboxes:
-            raise ValueError(f"Sandbox {session_id} does not exist")
+    def download_files(
+        self, session_id: str, src: str = "/workspace", compression: Optional[str] = "gzip"
+    ) -> bytes:
+        """
+        Download files from the sandbox as a tar archive.
+
+        Args:
+            session_id: Session identifier
+            src: Source directory (default: '/workspace')
+            compression: "gzip" (default, as served by HTTP backends), None for a
+                        plain tar, or "zstd" (Python 3.14+). The archive never
+                        leaves the process, so None saves the compression work.
 
-        sandbox = self._sandboxes[session_id]
-        sandbox_path = sandbox["path"]
-        src_path = self.sanitizer.sanitize(src, sandbox_path)
+        Returns:
+            Tar archive as bytes
+        """
+        sandbox = self._sandboxes.get(session_id)
+        if sandbox is None:
+            raise ValueError(f"Sandbox {session_id} does not exist")
+        src_path = self.sanitizer.sanitize(
+            src, sandbox.path, sandbox_resolved=sandbox.resolved_path
+        )
 
         if not src_path.exists():
             raise ValueError(f"Source path does not exist: {src}")
 
         # Use TarHandler to create tar archive from directory
-        return self.tar_handler.create_tar_from_directory(src_path, src_path)
+        return self.tar_handler.create_tar_from_directory(src_path, src_path, compression)
 
     def delete_sandbox(self, session_id: str) -> bool:
         """
         Delete a sandbox.
 
-        This removes the entire /tmp/{sandbox_id} directory.
+        This removes the entire /tmp/{sandbox_id} directory. The directory is
+        renamed out of the way at once and its contents are removed in the
+        background; call :meth:`close` to wait for that to finish.
         """
-        if session_id not in self._sandboxes:
+        sandbox = self._sandboxes.get(session_id)
+        if sandbox is None:
             return False
-
-        sandbox = self._sandboxes[session_id]
-        sandbox_path = sandbox["path"]
+        sandbox_path = sandbox.path
 
         # Remove entire sandbox directory
         if sandbox_path.exists():
-            shutil.rmtree(sandbox_path)
+            gc_dir = self.base_dir / "noxrunner_gc"
+            staging = gc_dir / uuid.uuid4().hex
+            try:
+                gc_dir.mkdir(exist_ok=True)
+                os.rename(sandbox_path, staging)
+            except OSError:
+                # Cannot stage it (e.g. base_dir is not writable): remove in place
+                shutil.rmtree(sandbox_path)
+            else:
+                self._schedule_removal(staging)
+        # Callers using the sanitizer without the record's resolved path
+        # (e.g. ensure_within_sandbox) go through its cache
+        self.sanitizer.invalidate(sandbox_path)
 
         del self._sandboxes[session_id]
         return True
 
+    def _schedule_removal(self, path: Path) -> None:
+        """Queue a staged directory for removal by the background thread."""
+        with self._gc_lock:
+            self._gc_pending.append(path)
+            if self._gc_thread is None:
+                # Not a daemon thread: the interpreter finishes pending
+                # removals before exiting instead of leaving them behind
+                self._gc_thread = threading.Thread(
+                    target=self._gc_worker, name="noxrunner-local-gc"
+                )
+                self._gc_thread.start()
+
+    def _gc_worker(self) -> None:
+        """Remove staged directories until none are pending."""
+        while True:
+            with self._gc_lock:
+                if not self._gc_pending:
+                    self._gc_thread = None
+                    return
+                path = self._gc_pending.popleft()
+            shutil.rmtree(path, ignore_errors=True)
+
+    def close(self) -> None:
+        """Wait for deleted sandboxes to be removed."""
+        with self._gc_lock:
+            thread = self._gc_thread
+        if thread is not None:
+            thread.join()
+
     def wait_for_pod_ready(self, session_id: str, timeout: int = 30, interval: int = 2) -> bool:
         """Wait for sandbox to be ready."""
-        if session_id not in self._sandboxes:
-            self.create_sandbox(session_id)
+        self._get_or_create(session_id)
 
         # Local sandbox is always ready immediately
         return True
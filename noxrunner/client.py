@@ -4,8 +4,10 @@ NoxRunner API Client
 Main client class for interacting with NoxRunner-compatible sandbox execution backends.
 """
 
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union, overload
 
 from noxrunner.backend.base import SandboxBackend
 from noxrunner.fileops.tar_handler import TarHandler
@@ -22,6 +24,10 @@ class NoxRunnerClient:
     This makes it suitable for environments where installing third-party packages
     is restricted or undesirable.
 
+    A single client can be shared across threads, e.g. to run several
+    ``exec`` calls or uploads in parallel; with an HTTP backend each
+    concurrent request uses its own pooled keep-alive connection.
+
     Example:
         >>> from noxrunner import NoxRunnerClient
         >>> client = NoxRunnerClient("http://127.0.0.1:8080")
@@ -30,7 +36,14 @@ class NoxRunnerClient:
         >>> print(result["stdout"])
     """
 
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30, local_test: bool = False):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        local_test: bool = False,
+        health_ttl: float = 2.0,
+        compression: Optional[str] = None,
+    ):
         """
         Initialize the NoxRunner client.
 
@@ -41,6 +54,15 @@ class NoxRunnerClient:
             timeout: Request timeout in seconds (default: 30)
             local_test: If True, use local sandbox backend for offline testing.
                        WARNING: This executes commands in your local environment!
+            health_ttl: Seconds a health_check() result is cached before the
+                       backend is queried again (default: 2.0, 0 disables caching)
+            compression: Compression for uploaded tar archives: None (default) for
+                       plain tar, "gzip", or "zstd" on Python 3.14+. Ignored in
+                       local sandbox mode.
+
+        Raises:
+            ValueError: If base_url is missing without local_test, or the
+                       compression is not supported
 
         Example:
             >>> client = NoxRunnerClient("http://127.0.0.1:8080", timeout=60)
@@ -62,15 +84,28 @@ class NoxRunnerClient:
             # Use new backend structure
             from noxrunner.backend.http import HTTPSandboxBackend
 
-            self._backend: SandboxBackend = HTTPSandboxBackend(base_url, timeout)
+            self._backend: SandboxBackend = HTTPSandboxBackend(
+                base_url, timeout, compression=compression
+            )
 
         # Initialize tar handler for file operations (internal module)
         self._tar_handler = TarHandler()
 
-    def health_check(self) -> bool:
+        # Cached health_check() result as (monotonic timestamp, healthy)
+        self._health_ttl = health_ttl
+        self._health_cache = (0.0, False)
+        self._health_lock = threading.Lock()
+
+    def health_check(self, force: bool = False) -> bool:
         """
         Check if the NoxRunner backend is healthy.
 
+        The result is cached for ``health_ttl`` seconds, so repeated checks
+        (e.g. pre-flight checks before each operation) cost a single request.
+
+        Args:
+            force: If True, bypass the cache and query the backend (default: False)
+
         Returns:
             True if healthy, False otherwise
 
@@ -78,7 +113,18 @@ class NoxRunnerClient:
             >>> if client.health_check():
             ...     print("Backend is healthy")
         """
-        return self._backend.health_check()
+        now = time.monotonic()
+        with self._health_lock:
+            checked_at, healthy = self._health_cache
+        if not force and checked_at and now - checked_at < self._health_ttl:
+            return healthy
+
+        healthy = self._backend.health_check()
+        with self._health_lock:
+            # Keep the newest result if another thread checked concurrently
+            if now >= self._health_cache[0]:
+                self._health_cache = (now, healthy)
+        return healthy
 
     def create_sandbox(
         self,
@@ -133,6 +179,40 @@ class NoxRunnerClient:
         """
         return self._backend.touch(session_id)
 
+    @overload
+    def exec(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = ...,
+        env: Optional[Dict[str, str]] = ...,
+        timeout_seconds: int = ...,
+        stream: Literal[False] = ...,
+    ) -> dict: ...
+
+    @overload
+    def exec(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = ...,
+        env: Optional[Dict[str, str]] = ...,
+        timeout_seconds: int = ...,
+        *,
+        stream: Literal[True],
+    ) -> Iterator[Tuple[str, bytes]]: ...
+
+    @overload
+    def exec(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = ...,
+        env: Optional[Dict[str, str]] = ...,
+        timeout_seconds: int = ...,
+        stream: bool = ...,
+    ) -> Union[dict, Iterator[Tuple[str, bytes]]]: ...
+
     def exec(
         self,
         session_id: str,
@@ -140,7 +220,8 @@ class NoxRunnerClient:
         workdir: str = "/workspace",
         env: Optional[Dict[str, str]] = None,
         timeout_seconds: int = 30,
-    ) -> dict:
+        stream: bool = False,
+    ) -> Union[dict, Iterator[Tuple[str, bytes]]]:
         """
         Execute a command in the sandbox.
 
@@ -150,9 +231,14 @@ class NoxRunnerClient:
             workdir: Working directory (default: '/workspace')
             env: Environment variables (optional)
             timeout_seconds: Command timeout in seconds (default: 30)
+            stream: If True, return an iterator over the output as it is
+                   produced instead of buffering it (default: False)
 
         Returns:
-            Dict with 'exitCode', 'stdout', 'stderr', 'durationMs'
+            Dict with 'exitCode', 'stdout', 'stderr', 'durationMs'. With
+            ``stream=True``, an iterator of (channel, data) tuples where channel
+            is 'stdout' or 'stderr'; the last tuple is ('exit', exit code as
+            ASCII bytes). Errors are raised while iterating.
 
         Raises:
             :exc:`~noxrunner.exceptions.NoxRunnerHTTPError`: If request fails
@@ -160,9 +246,50 @@ class NoxRunnerClient:
         Example:
             >>> result = client.exec("my-session", ["python3", "--version"])
             >>> print(result["stdout"])
+
+            >>> for channel, data in client.exec("my-session", ["make"], stream=True):
+            ...     if channel == "exit":
+            ...         exit_code = int(data)
+            ...     else:
+            ...         print(data.decode(), end="")
         """
+        if stream:
+            return self._backend.exec_stream(session_id, cmd, workdir, env, timeout_seconds)
         return self._backend.exec(session_id, cmd, workdir, env, timeout_seconds)
 
+    async def exec_async(
+        self,
+        session_id: str,
+        cmd: List[str],
+        workdir: str = "/workspace",
+        env: Optional[Dict[str, str]] = None,
+        timeout_seconds: int = 30,
+    ) -> dict:
+        """
+        Asynchronously execute a command in the sandbox.
+
+        Many commands can run concurrently from one event loop, e.g. with
+        :func:`asyncio.gather`.
+
+        Args:
+            session_id: Session identifier
+            cmd: Command to execute (list of strings)
+            workdir: Working directory (default: '/workspace')
+            env: Environment variables (optional)
+            timeout_seconds: Command timeout in seconds (default: 30)
+
+        Returns:
+            Dict with 'exitCode', 'stdout', 'stderr', 'durationMs'
+
+        Raises:
+            :exc:`~noxrunner.exceptions.NoxRunnerHTTPError`: If request fails
+
+        Example:
+            >>> result = await client.exec_async("my-session", ["python3", "--version"])
+            >>> print(result["stdout"])
+        """
+        return await self._backend.exec_async(session_id, cmd, workdir, env, timeout_seconds)
+
     def exec_shell(
         self,
         session_id: str,
@@ -229,6 +356,10 @@ class NoxRunnerClient:
         """
         Upload files to the sandbox.
 
+        All files are sent as a single tar archive in one request. Batch files
+        into one call rather than calling this once per file; to upload a
+        whole local directory use :meth:`upload_files_from_dir`.
+
         Args:
             session_id: Session identifier
             files: Dict mapping file paths to content (str or bytes)
@@ -249,6 +380,37 @@ class NoxRunnerClient:
         """
         return self._backend.upload_files(session_id, files, dest)
 
+    def upload_files_from_dir(
+        self, session_id: str, local_dir: Union[str, Path], dest: str = "/workspace"
+    ) -> bool:
+        """
+        Upload the contents of a local directory to the sandbox.
+
+        This is the counterpart of :meth:`download_workspace`. The directory is
+        packed into a single tar archive and sent in one request, with paths
+        relative to ``local_dir``.
+
+        Args:
+            session_id: Session identifier
+            local_dir: Local directory to upload
+            dest: Destination directory (default: '/workspace')
+
+        Returns:
+            True if successful
+
+        Raises:
+            :exc:`~noxrunner.exceptions.NoxRunnerHTTPError`: If request fails
+            ValueError: If local_dir is not a directory
+
+        Example:
+            >>> client.upload_files_from_dir("my-session", "./project")
+            True
+        """
+        local_path = Path(local_dir)
+        if not local_path.is_dir():
+            raise ValueError(f"Not a directory: {local_dir}")
+        return self._backend.upload_directory(session_id, local_path, dest)
+
     def download_files(self, session_id: str, src: str = "/workspace") -> bytes:
         """
         Download files from the sandbox as a tar archive.
@@ -337,7 +499,7 @@ class NoxRunnerClient:
 
     def wait_for_pod_ready(self, session_id: str, timeout: int = 30, interval: int = 2) -> bool:
         """
-        Wait for the sandbox execution environment to be ready by polling with a simple command.
+        Wait for the sandbox execution environment to be ready by polling its readiness.
 
         Args:
             session_id: Session identifier
@@ -352,3 +514,45 @@ class NoxRunnerClient:
             ...     print("Sandbox is ready")
         """
         return self._backend.wait_for_pod_ready(session_id, timeout, interval)
+
+    async def wait_for_pod_ready_async(
+        self, session_id: str, timeout: int = 30, interval: int = 2
+    ) -> bool:
+        """
+        Asynchronously wait for the sandbox execution environment to be ready.
+
+        Awaitable counterpart of :meth:`wait_for_pod_ready`. With an HTTP backend,
+        several probes are kept in flight with staggered starts, so readiness is
+        detected sooner than with sequential polling.
+
+        Args:
+            session_id: Session identifier
+            timeout: Maximum time to wait in seconds (default: 30)
+            interval: Polling interval in seconds (default: 2)
+
+        Returns:
+            True if sandbox is ready, False if timeout
+
+        Example:
+            >>> ready = await client.wait_for_pod_ready_async("my-session", timeout=60)
+        """
+        return await self._backend.wait_for_pod_ready_async(session_id, timeout, interval)
+
+    def close(self) -> None:
+        """
+        Release resources held by the client, such as pooled HTTP connections.
+
+        The client can also be used as a context manager, which calls this
+        method on exit.
+
+        Example:
+            >>> with NoxRunnerClient("http://127.0.0.1:8080") as client:
+            ...     client.health_check()
+        """
+        self._backend.close()
+
+    def __enter__(self) -> "NoxRunnerClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -6,10 +6,109 @@ used in file synchronization between local and sandbox environments.
 """
 
 import io
+import os
+import stat
 import sys
 import tarfile
+import time
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import BinaryIO, Dict, Optional, Union
+
+# Supported archive compressions mapped to their tarfile mode suffix.
+# zstd is only available in the standard library from Python 3.14 on.
+_COMPRESSION_SUFFIXES = {None: "", "gzip": "gz", "zstd": "zst"}
+
+# Block size used when streaming archives to a file object
+_STREAM_BUFSIZE = 64 * 1024
+
+# Block size used when writing extracted member data to disk
+_EXTRACT_BUFSIZE = 1024 * 1024
+
+# Flags for extracted files; O_CLOEXEC and O_BINARY exist only on POSIX and
+# Windows respectively
+_EXTRACT_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _stream_write_mode(compression: Optional[str]) -> str:
+    """Return the streaming tarfile write mode for the given compression."""
+    if compression not in _COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression!r}")
+    if compression == "zstd" and sys.version_info < (3, 14):
+        raise ValueError("zstd compression requires Python 3.14 or newer")
+    return f"w|{_COMPRESSION_SUFFIXES[compression]}"
+
+
+class _BufferReader:
+    """
+    Minimal read-only file object over a bytes-like object.
+
+    Unlike io.BytesIO it never copies the underlying buffer: read() returns
+    memoryview slices, which tarfile writes out directly.
+    """
+
+    __slots__ = ("_view", "_pos")
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        self._view = memoryview(data)
+        self._pos = 0
+
+    def read(self, size: Optional[int] = -1) -> memoryview:
+        """Read up to size bytes (all remaining bytes if size is negative or None)."""
+        start = self._pos
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        self._pos = end
+        return self._view[start:end]
+
+
+class _BytesBufferReader(_BufferReader):
+    """
+    _BufferReader variant whose read() returns bytes.
+
+    tarfile's stream readers need bytes methods (e.g. to sniff the compression),
+    so each read copies one block; the buffer as a whole is never copied.
+    """
+
+    __slots__ = ()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to size bytes (all remaining bytes if size is negative or None)."""
+        return bytes(super().read(size))
+
+
+class _ExtractTarFile(tarfile.TarFile):
+    """
+    TarFile that writes extracted regular files with raw os.write() calls.
+
+    The stock makefile() wraps every member in a buffered file object, which
+    dominates extraction time for archives of many small files. Sparse
+    members are left to the stock implementation.
+    """
+
+    def makefile(self, tarinfo: tarfile.TarInfo, targetpath: str) -> None:
+        if tarinfo.sparse is not None:
+            super().makefile(tarinfo, targetpath)
+            return
+
+        source = self.fileobj
+        source.seek(tarinfo.offset_data)
+        fd = os.open(targetpath, _EXTRACT_FLAGS, 0o666)
+        try:
+            remaining = tarinfo.size
+            while remaining:
+                data = source.read(min(remaining, _EXTRACT_BUFSIZE))
+                if not data:
+                    raise tarfile.ReadError("unexpected end of data")
+                remaining -= len(data)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
 
 class TarHandler:
@@ -20,18 +119,51 @@ class TarHandler:
     and extract tar archives to directories, with security checks.
     """
 
-    def create_tar(self, files: Dict[str, Union[str, bytes]]) -> bytes:
+    def create_tar(
+        self, files: Dict[str, Union[str, bytes]], compression: Optional[str] = None
+    ) -> bytes:
         """
         Create a tar archive from a dictionary of files.
 
         Args:
             files: Dictionary mapping file paths to content (str or bytes)
+            compression: None for a plain tar (default), "gzip", or "zstd" (Python 3.14+)
 
         Returns:
-            Tar archive as bytes (gzip compressed)
+            Tar archive as bytes
+
+        Raises:
+            ValueError: If the compression is not supported
         """
         tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+        self.write_tar(files, tar_buffer, compression)
+        return tar_buffer.getvalue()
+
+    def write_tar(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        fileobj: BinaryIO,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Stream a tar archive of a dictionary of files into a writable file object.
+
+        The archive is written sequentially and never held in memory as a whole,
+        so fileobj can be a socket or HTTP request body.
+
+        Args:
+            files: Dictionary mapping file paths to content (str or bytes)
+            fileobj: Writable binary file object (only write() is used)
+            compression: None for a plain tar (default), "gzip", or "zstd" (Python 3.14+)
+
+        Raises:
+            ValueError: If the compression is not supported
+        """
+        mode = _stream_write_mode(compression)
+        # Attributes shared by all members are computed once per archive.
+        # A fresh TarInfo per member is cheaper than copying a template.
+        mtime = int(time.time())
+        with tarfile.open(fileobj=fileobj, mode=mode, bufsize=_STREAM_BUFSIZE) as tar:
             for filepath, content in files.items():
                 # Convert string to bytes if needed
                 if isinstance(content, str):
@@ -42,41 +174,119 @@ class TarHandler:
                 # Create tar info
                 info = tarfile.TarInfo(name=filepath)
                 info.size = len(content_bytes)
-                tar.addfile(info, io.BytesIO(content_bytes))
+                info.mtime = mtime
+                tar.addfile(info, _BufferReader(content_bytes))
 
-        tar_buffer.seek(0)
-        return tar_buffer.read()
-
-    def create_tar_from_directory(self, directory: Path, src: Path) -> bytes:
+    def create_tar_from_directory(
+        self, directory: Path, src: Path, compression: Optional[str] = "gzip"
+    ) -> bytes:
         """
         Create a tar archive from a directory.
 
         Args:
             directory: Directory to archive
             src: Source path (for relative path calculation)
+            compression: None, "gzip" (default), or "zstd" (Python 3.14+)
 
         Returns:
-            Tar archive as bytes (gzip compressed)
+            Tar archive as bytes
         """
         tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
-            if directory.is_file():
+        self.write_tar_from_directory(directory, src, tar_buffer, compression)
+        return tar_buffer.getvalue()
+
+    def write_tar_from_directory(
+        self,
+        directory: Path,
+        src: Path,
+        fileobj: BinaryIO,
+        compression: Optional[str] = "gzip",
+        follow_symlinks: bool = False,
+    ) -> None:
+        """
+        Stream a tar archive of a directory into a writable file object.
+
+        Args:
+            directory: Directory to archive
+            src: Source path (for relative path calculation)
+            fileobj: Writable binary file object (only write() is used)
+            compression: None, "gzip" (default), or "zstd" (Python 3.14+)
+            follow_symlinks: Store the contents of symlinked files instead of
+                            the links; links to directories and dangling links
+                            are then skipped (default: False)
+
+        Raises:
+            ValueError: If the compression is not supported
+        """
+        mode = _stream_write_mode(compression)
+        # One stat decides between a single file and a directory tree; a
+        # missing path yields an empty archive
+        try:
+            st_mode = os.stat(directory).st_mode
+        except OSError:
+            st_mode = 0
+        with tarfile.open(fileobj=fileobj, mode=mode, bufsize=_STREAM_BUFSIZE) as tar:
+            if stat.S_ISREG(st_mode):
                 tar.add(directory, arcname=directory.name)
-            elif directory.is_dir():
-                import os
+            elif stat.S_ISDIR(st_mode):
+                rel = directory.relative_to(src).as_posix()
+                self._add_directory(
+                    tar, str(directory), "" if rel == "." else rel + "/", follow_symlinks
+                )
+
+    def _add_directory(
+        self, tar: tarfile.TarFile, directory: str, prefix: str, follow_symlinks: bool = False
+    ) -> None:
+        """
+        Add the files and symlinks below a directory to an open tar archive.
 
-                for root, dirs, files in os.walk(directory):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(src)
-                        tar.add(file_path, arcname=str(arcname))
+        Entries are listed with os.scandir and described from the stat result
+        cached on each DirEntry, so every file is stat'ed once. Symlinks are
+        stored as links unless follow_symlinks is set, in which case symlinked
+        files are stored as regular files; other special files are skipped.
 
-        tar_buffer.seek(0)
-        return tar_buffer.read()
+        Args:
+            tar: Tar archive open for writing
+            directory: Directory to walk
+            prefix: Archive name prefix for entries of directory ("" or ending in "/")
+            follow_symlinks: Store symlinked files by content (default: False)
+        """
+        pending = [(directory, prefix)]
+        while pending:
+            path, prefix = pending.pop()
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, prefix + entry.name + "/"))
+                        continue
+
+                    st = entry.stat(follow_symlinks=False)
+                    is_link = stat.S_ISLNK(st.st_mode)
+                    if is_link and follow_symlinks:
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue  # Dangling link
+                        is_link = False
+
+                    info = tarfile.TarInfo(name=prefix + entry.name)
+                    info.mode = stat.S_IMODE(st.st_mode)
+                    info.mtime = int(st.st_mtime)
+                    info.uid = st.st_uid
+                    info.gid = st.st_gid
+
+                    if is_link:
+                        info.type = tarfile.SYMTYPE
+                        info.linkname = os.readlink(entry.path)
+                        tar.addfile(info)
+                    elif stat.S_ISREG(st.st_mode):
+                        info.size = st.st_size
+                        with open(entry.path, "rb") as f:
+                            tar.addfile(info, f)
 
     def extract_tar(
         self,
-        tar_data: bytes,
+        tar_data: Union[bytes, bytearray, memoryview, BinaryIO],
         dest: Path,
         sandbox_path: Optional[Path] = None,
         allow_absolute: bool = False,
@@ -85,7 +295,9 @@ class TarHandler:
         Extract a tar archive to a directory.
 
         Args:
-            tar_data: Tar archive data (bytes)
+            tar_data: Tar archive data (bytes-like), or a readable binary file
+                     object such as an open archive file, which is streamed
+                     without loading it into memory
             dest: Destination directory
             sandbox_path: Optional sandbox path for security checks
             allow_absolute: Whether to allow absolute paths (default: False)
@@ -93,56 +305,103 @@ class TarHandler:
         Returns:
             Number of files extracted
         """
-        if not tar_data or len(tar_data) == 0:
-            return 0
+        if isinstance(tar_data, (bytes, bytearray, memoryview)):
+            if not tar_data:
+                return 0
+            # io.BytesIO shares the buffer of an immutable bytes object, but
+            # would copy any other buffer; read those in place instead.
+            if isinstance(tar_data, bytes):
+                tar_buffer = io.BytesIO(tar_data)
+            else:
+                tar_buffer = _BytesBufferReader(tar_data)
+        else:
+            tar_buffer = tar_data
 
         dest.mkdir(parents=True, exist_ok=True)
         file_count = 0
 
-        tar_buffer = io.BytesIO(tar_data)
-        with tarfile.open(fileobj=tar_buffer, mode="r:*") as tar:
-            for member in tar.getmembers():
-                # Security: Skip absolute paths and paths with .. unless allowed
-                if not allow_absolute and (member.name.startswith("/") or ".." in member.name):
-                    continue
-
-                # Skip directories (they will be created automatically)
-                if member.isdir():
-                    continue
-
-                # Get target path
-                target_path = dest / member.name
-
-                # Security check: Ensure target is within dest (or sandbox if provided)
-                # First check if member.name itself is safe
-                if ".." in member.name or member.name.startswith("/"):
-                    # Path traversal in name, skip
-                    continue
-
-                if sandbox_path:
-                    try:
-                        target_path.resolve().relative_to(sandbox_path.resolve())
-                    except ValueError:
-                        # Path outside sandbox, skip
+        # Resolve the destination and the confinement root once per archive;
+        # per-member name checks are then pure string operations.
+        dest_resolved = str(dest.resolve())
+        root = str(sandbox_path.resolve()) if sandbox_path else dest_resolved
+
+        # The 'data' filter (Python 3.12+, backported to 3.8.17+, 3.9.17+,
+        # 3.10.12+ and 3.11.4+) also rejects members written through symlinks,
+        # whether extracted earlier or already in dest. Without it, each
+        # member's parent directory is resolved and checked instead.
+        use_data_filter = hasattr(tarfile, "data_filter")
+
+        # Streaming mode reads headers as it goes instead of indexing the whole
+        # archive up front; members are extracted strictly in archive order.
+        with _ExtractTarFile.open(fileobj=tar_buffer, mode="r|*") as tar:
+
+            def safe_members():
+                nonlocal file_count
+                for member in tar:
+                    # Skip directories (they will be created automatically)
+                    if member.isdir():
                         continue
-                else:
-                    # Ensure target is within dest
-                    try:
-                        target_path.resolve().relative_to(dest.resolve())
-                    except ValueError:
-                        # Path outside dest, skip
+
+                    # Security check: Ensure target is within dest (or sandbox if provided)
+                    if not self._is_safe_member(member.name, dest_resolved, root):
+                        continue
+                    if not use_data_filter and not self._is_safe_parent(
+                        member.name, dest_resolved, root
+                    ):
                         continue
 
-                # Create parent directories
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                    file_count += 1
+                    yield member
 
-                # Extract file with filter for Python 3.12+
+            # tarfile creates missing parent directories itself. Members are
+            # fed lazily so the archive is still read in a single pass.
+            if use_data_filter:
                 # Use 'data' filter for security (restricts symlinks, devices, etc.)
-                # We've already done path traversal checks above
-                if sys.version_info >= (3, 12):
-                    tar.extract(member, dest, filter="data")
-                else:
+                tar.extractall(dest, members=safe_members(), filter="data")
+            else:
+                for member in safe_members():
                     tar.extract(member, dest)
-                file_count += 1
 
         return file_count
+
+    def _is_safe_member(self, name: str, dest_resolved: str, root: str) -> bool:
+        """
+        Check that a tar member name stays within root when extracted to dest.
+
+        Args:
+            name: Member name from the archive
+            dest_resolved: Resolved destination directory
+            root: Resolved directory the member must stay within
+
+        Returns:
+            True if the member is safe to extract
+        """
+        # Security: Reject absolute paths and path traversal in the name itself
+        if name.startswith("/"):
+            return False
+        if ".." in name or "\\" in name:
+            # Slow path: reject ".." components, treating backslashes as separators.
+            # Names like "file..txt" are allowed.
+            if ".." in name.replace("\\", "/").split("/"):
+                return False
+
+        target = os.path.normpath(os.path.join(dest_resolved, name))
+        return os.path.commonpath([root, target]) == root
+
+    def _is_safe_parent(self, name: str, dest_resolved: str, root: str) -> bool:
+        """
+        Check that a member's parent directory, with symlinks resolved, is within root.
+
+        Members are extracted in archive order, so links created by earlier
+        members are followed as well as links already present in dest.
+
+        Args:
+            name: Member name from the archive (already checked by _is_safe_member)
+            dest_resolved: Resolved destination directory
+            root: Resolved directory the member must stay within
+
+        Returns:
+            True if the member is written within root
+        """
+        parent = os.path.realpath(os.path.dirname(os.path.join(dest_resolved, name)))
+        return os.path.commonpath([root, parent]) == root
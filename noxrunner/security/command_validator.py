@@ -18,79 +18,86 @@ class CommandValidator:
 
     # Security: Allowed commands that are safe to execute
     # Only allow read/write operations, no deletion or execution outside sandbox
-    ALLOWED_COMMANDS = {
-        "echo",
-        "cat",
-        "ls",
-        "pwd",
-        "head",
-        "tail",
-        "grep",
-        "wc",
-        "sort",
-        "python",
-        "python3",
-        "python2",
-        "node",
-        "bash",
-        "sh",
-        "zsh",
-        "test",
-        "[",
-        "true",
-        "false",
-        "which",
-        "type",
-        "env",
-        "printenv",
-        "mkdir",
-        "touch",
-        "cp",
-        "mv",
-        "ln",
-        "readlink",
-        "stat",
-        "file",
-        "find",
-        "xargs",
-        "sed",
-        "awk",
-        "cut",
-        "tr",
-        "uniq",
-        "diff",
-        "cmp",
-        "tar",
-        "gzip",
-        "gunzip",
-        "zip",
-        "unzip",
-    }
-
-    # Dangerous commands that should be blocked
-    BLOCKED_COMMANDS = {
-        "rm",
-        "rmdir",
-        "unlink",
-        "del",
-        "format",
-        "mkfs",
-        "dd",
-        "fdisk",
-        "shutdown",
-        "reboot",
-        "halt",
-        "poweroff",
-        "init",
-        "killall",
-        "sudo",
-        "su",
-        "chmod",
-        "chown",
-        "chgrp",
-        "mount",
-        "umount",
-    }
+    ALLOWED_COMMANDS = frozenset(
+        {
+            "echo",
+            "cat",
+            "ls",
+            "pwd",
+            "head",
+            "tail",
+            "grep",
+            "wc",
+            "sort",
+            "python",
+            "python3",
+            "python2",
+            "node",
+            "bash",
+            "sh",
+            "zsh",
+            "test",
+            "[",
+            "true",
+            "false",
+            "sleep",
+            "which",
+            "type",
+            "env",
+            "printenv",
+            "mkdir",
+            "touch",
+            "cp",
+            "mv",
+            "ln",
+            "readlink",
+            "stat",
+            "file",
+            "find",
+            "xargs",
+            "sed",
+            "awk",
+            "cut",
+            "tr",
+            "uniq",
+            "diff",
+            "cmp",
+            "tar",
+            "gzip",
+            "gunzip",
+            "zip",
+            "unzip",
+        }
+    )
+
+    # Dangerous commands that should be blocked. validate() only runs allowed
+    # commands, so these are rejected anyway; the list documents the intent
+    # and backs is_blocked()
+    BLOCKED_COMMANDS = frozenset(
+        {
+            "rm",
+            "rmdir",
+            "unlink",
+            "del",
+            "format",
+            "mkfs",
+            "dd",
+            "fdisk",
+            "shutdown",
+            "reboot",
+            "halt",
+            "poweroff",
+            "init",
+            "killall",
+            "sudo",
+            "su",
+            "chmod",
+            "chown",
+            "chgrp",
+            "mount",
+            "umount",
+        }
+    )
 
     def validate(self, cmd: List[str]) -> bool:
         """
@@ -105,15 +112,8 @@ class CommandValidator:
         if not cmd:
             return False
 
-        command = cmd[0].lower()
-
-        # Block dangerous commands
-        if command in self.BLOCKED_COMMANDS:
-            return False
-
-        # For testing, allow common commands
-        # In production, this should be more restrictive
-        return True
+        # Only allow safe commands; blocked commands are never on the allowlist
+        return self.is_allowed(cmd[0])
 
     def is_allowed(self, command: str) -> bool:
         """
@@ -125,7 +125,11 @@ class CommandValidator:
         Returns:
             True if command is allowed
         """
-        return command.lower() in self.ALLOWED_COMMANDS
+        if command in self.ALLOWED_COMMANDS:
+            return True
+        # Commands are nearly always lowercase already; only other spellings
+        # (e.g. "ECHO") need a lowercased copy
+        return not command.islower() and command.lower() in self.ALLOWED_COMMANDS
 
     def is_blocked(self, command: str) -> bool:
         """
@@ -137,4 +141,8 @@ class CommandValidator:
         Returns:
             True if command is blocked
         """
-        return command.lower() in self.BLOCKED_COMMANDS
+        if command in self.BLOCKED_COMMANDS:
+            return True
+        # Commands are nearly always lowercase already; only other spellings
+        # (e.g. "RM") need a lowercased copy
+        return not command.islower() and command.lower() in self.BLOCKED_COMMANDS
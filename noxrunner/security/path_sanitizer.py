@@ -7,6 +7,7 @@ in sandbox environments.
 
 import os
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 
 class PathSanitizer:
@@ -17,7 +18,43 @@ class PathSanitizer:
     are within the sandbox directory.
     """
 
-    def sanitize(self, path: str, sandbox_path: Path, workspace_name: str = "workspace") -> Path:
+    def __init__(self):
+        """Initialize the sanitizer."""
+        # (sandbox_path, workspace_name) -> (resolved sandbox, workspace)
+        self._resolved_cache: Dict[Tuple[Path, str], Tuple[Path, Path]] = {}
+
+    def _resolve_sandbox(self, sandbox_path: Path, workspace_name: str) -> Tuple[Path, Path]:
+        """
+        Return the resolved sandbox directory and its workspace directory.
+
+        Resolving a path stats every component, so the result is cached per
+        sandbox until :meth:`invalidate` is called for it.
+        """
+        key = (sandbox_path, workspace_name)
+        cached = self._resolved_cache.get(key)
+        if cached is None:
+            sandbox_resolved = sandbox_path.resolve()
+            cached = (sandbox_resolved, sandbox_resolved / workspace_name)
+            self._resolved_cache[key] = cached
+        return cached
+
+    def invalidate(self, sandbox_path: Path) -> None:
+        """
+        Drop cached resolutions for a sandbox (e.g. when it is deleted).
+
+        Args:
+            sandbox_path: Base sandbox directory path
+        """
+        for key in [key for key in self._resolved_cache if key[0] == sandbox_path]:
+            del self._resolved_cache[key]
+
+    def sanitize(
+        self,
+        path: str,
+        sandbox_path: Path,
+        workspace_name: str = "workspace",
+        sandbox_resolved: Optional[Path] = None,
+    ) -> Path:
         """
         Sanitize a path to ensure it's within the sandbox.
 
@@ -25,6 +62,8 @@ class PathSanitizer:
             path: Path to sanitize (can be absolute or relative)
             sandbox_path: Base sandbox directory path
             workspace_name: Name of the workspace directory (default: "workspace")
+            sandbox_resolved: sandbox_path already resolved by the caller
+                             (optional, skips the resolution cache)
 
         Returns:
             Sanitized Path object that is guaranteed to be within sandbox
@@ -34,8 +73,23 @@ class PathSanitizer:
             - Redirects paths outside sandbox to workspace root
             - Handles both absolute and relative paths
         """
-        sandbox_resolved = sandbox_path.resolve()
-        workspace = sandbox_resolved / workspace_name
+        if sandbox_resolved is None:
+            sandbox_resolved, workspace = self._resolve_sandbox(sandbox_path, workspace_name)
+        else:
+            workspace = sandbox_resolved / workspace_name
+
+        # The workspace root itself (the default workdir/dest/src) needs no
+        # resolution: both forms below always sanitize to it
+        if not path or path == "/" + workspace_name:
+            return workspace
+
+        # Plain file names (the common case) need no normalization; a name that
+        # is not a symlink cannot point outside the workspace, so a single
+        # lstat replaces resolving every path component
+        if "/" not in path and "\\" not in path and path.strip("."):
+            candidate = workspace / path
+            if not os.path.islink(candidate):
+                return candidate
 
         # Resolve relative paths
         if os.path.isabs(path):
@@ -54,7 +108,7 @@ class PathSanitizer:
                 return workspace
         else:
             # Relative path, check for path traversal first
-            if ".." in path or path.startswith("/"):
+            if self.has_traversal(path) or path.startswith("/"):
                 # Path traversal detected, return workspace root
                 return workspace
 
@@ -71,6 +125,26 @@ class PathSanitizer:
             except (OSError, ValueError):
                 return workspace
 
+    def has_traversal(self, path: str) -> bool:
+        """
+        Check if a relative path has a parent-directory component.
+
+        Any component made only of dots (other than ".") counts, so "..." is
+        rejected too, while names merely containing dots ("v1..2") are not.
+
+        Args:
+            path: Relative path, with "/" or "\\" separators
+
+        Returns:
+            True if the path contains a traversal component, False otherwise
+        """
+        if ".." not in path:
+            return False
+        # str.strip() is cheaper than building a set of each component's characters
+        return any(
+            len(part) > 1 and not part.strip(".") for part in path.replace("\\", "/").split("/")
+        )
+
     def ensure_within_sandbox(self, path: Path, sandbox_path: Path) -> bool:
         """
         Check if a path is within the sandbox.
@@ -82,8 +156,11 @@ class PathSanitizer:
         Returns:
             True if path is within sandbox, False otherwise
         """
+        # The sandbox side comes from the resolution cache; only the path
+        # being checked has to be resolved (it may contain symlinks or "..")
+        sandbox_resolved, _ = self._resolve_sandbox(sandbox_path, "workspace")
         try:
-            path.resolve().relative_to(sandbox_path.resolve())
+            path.resolve().relative_to(sandbox_resolved)
             return True
         except ValueError:
             return False
@@ -4,10 +4,14 @@ Comprehensive tests for LocalBackend.
 Tests all functionality of the local backend implementation.
 """
 
+import asyncio
 import os
 import shutil
 import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -29,6 +33,7 @@ class TestLocalBackend:
             self.backend.delete_sandbox(self.session_id)
         except Exception:
             pass
+        self.backend.close()
         if os.path.exists(self.test_base):
             shutil.rmtree(self.test_base)
 
@@ -43,6 +48,8 @@ class TestLocalBackend:
         assert "podName" in result
         assert "expiresAt" in result
         assert result["podName"] == f"local-{self.session_id}"
+        expires_at = datetime.fromisoformat(result["expiresAt"].rstrip("Z"))
+        assert abs(expires_at.timestamp() - (time.time() + 300)) < 60
 
         # Verify sandbox directory exists
         sandbox_path = self.backend._get_sandbox_path(self.session_id)
@@ -66,9 +73,13 @@ class TestLocalBackend:
     def test_touch(self):
         """Test extending sandbox TTL."""
         self.backend.create_sandbox(self.session_id, ttl_seconds=300)
+        sandbox = self.backend._sandboxes[self.session_id]
+        expires_at = sandbox.expires_at
 
         result = self.backend.touch(self.session_id)
         assert result is True
+        assert sandbox.ttl_seconds == 300
+        assert sandbox.expires_at >= expires_at
 
     def test_touch_nonexistent_sandbox(self):
         """Test touching non-existent sandbox (should create it)."""
@@ -76,6 +87,15 @@ class TestLocalBackend:
         assert result is True
         assert self.session_id in self.backend._sandboxes
 
+    def test_upload_files_creates_sandbox(self):
+        """Test that uploading to a non-existent sandbox creates it once."""
+        self.backend.upload_files(self.session_id, {"a.txt": "a"})
+        sandbox = self.backend._sandboxes[self.session_id]
+
+        self.backend.upload_files(self.session_id, {"b.txt": "b"})
+        assert self.backend._sandboxes[self.session_id] is sandbox
+        assert (sandbox.path / "workspace" / "a.txt").read_text() == "a"
+
     def test_exec_simple_command(self):
         """Test executing a simple command."""
         self.backend.create_sandbox(self.session_id)
@@ -85,6 +105,16 @@ class TestLocalBackend:
         assert result["exitCode"] == 0
         assert "hello" in result["stdout"]
 
+    def test_exec_warns_once(self, capsys):
+        """Test that the exec warning is only printed for the first command."""
+        capsys.readouterr()
+
+        self.backend.exec(self.session_id, ["echo", "first"])
+        assert "Executing command in LOCAL environment: echo first" in capsys.readouterr().err
+
+        self.backend.exec(self.session_id, ["echo", "second"])
+        assert capsys.readouterr().err == ""
+
     def test_exec_command_with_output(self):
         """Test executing command that produces output."""
         self.backend.create_sandbox(self.session_id)
@@ -120,6 +150,19 @@ class TestLocalBackend:
         assert result["exitCode"] == 1
         assert "not allowed" in result["stderr"].lower()
 
+    def test_exec_unlisted_command(self):
+        """Test the exact result for a command rejected by the allowlist."""
+        self.backend.create_sandbox(self.session_id)
+
+        result = self.backend.exec(self.session_id, ["curl", "http://example.com"])
+
+        assert result == {
+            "exitCode": 1,
+            "stdout": "",
+            "stderr": "Command not allowed: curl",
+            "durationMs": 0,
+        }
+
     def test_exec_with_workdir(self):
         """Test executing command in specific workdir."""
         self.backend.create_sandbox(self.session_id)
@@ -133,6 +176,81 @@ class TestLocalBackend:
 
         assert result["exitCode"] == 0
 
+    def test_exec_concurrent_workdirs(self):
+        """Test that concurrent execs each run in their own workdir."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.backend.create_sandbox(self.session_id)
+        workspace = self.backend._get_sandbox_path(self.session_id) / "workspace"
+        for name in ("a", "b", "c", "d"):
+            (workspace / name).mkdir()
+        cwd = os.getcwd()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(
+                    lambda name: self.backend.exec(self.session_id, ["pwd"], workdir=name),
+                    ["a", "b", "c", "d"] * 3,
+                )
+            )
+
+        for name, result in zip(["a", "b", "c", "d"] * 3, results):
+            assert result["stdout"].strip() == str((workspace / name).resolve())
+        # The test process's own working directory is never changed
+        assert os.getcwd() == cwd
+
+    def test_exec_async(self):
+        """Test executing commands concurrently with exec_async."""
+        self.backend.create_sandbox(self.session_id)
+        # Allow a command that does not exist to reach the subprocess launch
+        self.backend.validator.ALLOWED_COMMANDS = self.backend.validator.ALLOWED_COMMANDS | {
+            "nonexistent_command_xyz"
+        }
+
+        async def run_all():
+            return await asyncio.gather(
+                self.backend.exec_async(self.session_id, ["echo", "one"]),
+                self.backend.exec_async(self.session_id, ["sh", "-c", "echo two >&2; exit 3"]),
+                self.backend.exec_async(self.session_id, ["sleep", "5"], timeout_seconds=0.2),
+                self.backend.exec_async(self.session_id, ["nonexistent_command_xyz"]),
+                self.backend.exec_async(self.session_id, ["rm", "-rf", "/"]),
+            )
+
+        ok, failed, timed_out, missing, blocked = asyncio.run(run_all())
+
+        assert ok["exitCode"] == 0
+        assert ok["stdout"] == "one\n"
+        assert failed["exitCode"] == 3
+        assert failed["stderr"] == "two\n"
+        assert timed_out["exitCode"] == 124
+        assert missing["exitCode"] == 127
+        assert blocked["exitCode"] == 1
+        assert "not allowed" in blocked["stderr"]
+
+    def test_exec_async_cancelled(self):
+        """Test that cancelling exec_async kills and reaps the child process."""
+        self.backend.create_sandbox(self.session_id)
+        procs = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def capture(*args, **kwargs):
+            proc = await create_subprocess_exec(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self.backend.exec_async(self.session_id, ["sleep", "30"], timeout_seconds=60),
+                    0.5,
+                )
+
+        with patch("noxrunner.backend.local.asyncio.create_subprocess_exec", capture):
+            asyncio.run(run())
+
+        assert len(procs) == 1
+        assert procs[0].returncode is not None
+
     def test_exec_with_env(self):
         """Test executing command with environment variables."""
         self.backend.create_sandbox(self.session_id)
@@ -167,6 +285,29 @@ class TestLocalBackend:
         assert (workspace / "test1.txt").read_text() == "Hello, World!"
         assert (workspace / "test2.txt").read_bytes() == b"Binary data"
 
+    def test_upload_files_overwrites(self):
+        """Test that re-uploading a file replaces (not appends to) its content."""
+        self.backend.create_sandbox(self.session_id)
+        large = b"x" * (4 * 1024 * 1024)
+
+        self.backend.upload_files(self.session_id, {"data.bin": large})
+        workspace = self.backend._get_sandbox_path(self.session_id) / "workspace"
+        assert (workspace / "data.bin").read_bytes() == large
+
+        self.backend.upload_files(self.session_id, {"data.bin": "short"})
+        assert (workspace / "data.bin").read_bytes() == b"short"
+
+    def test_upload_files_dots_in_names(self):
+        """Test that names containing ".." are kept unless they traverse."""
+        self.backend.create_sandbox(self.session_id)
+
+        self.backend.upload_files(self.session_id, {"v1..2/a.txt": "a", "x/../b.txt": "b"})
+
+        workspace = self.backend._get_sandbox_path(self.session_id) / "workspace"
+        assert (workspace / "v1..2" / "a.txt").read_text() == "a"
+        # Traversing paths are reduced to their file name
+        assert (workspace / "b.txt").read_text() == "b"
+
     def test_upload_files_to_subdirectory(self):
         """Test uploading files to subdirectory."""
         self.backend.create_sandbox(self.session_id)
@@ -209,6 +350,21 @@ class TestLocalBackend:
             assert "file2.txt" in members
             assert "subdir/file3.txt" in members
 
+    def test_download_files_uncompressed(self):
+        """Test downloading files as a plain tar archive."""
+        import io
+        import tarfile
+
+        self.backend.create_sandbox(self.session_id)
+        workspace = self.backend._get_sandbox_path(self.session_id) / "workspace"
+        (workspace / "file1.txt").write_text("content1")
+
+        assert self.backend.download_files(self.session_id)[:2] == b"\x1f\x8b"
+
+        tar_data = self.backend.download_files(self.session_id, compression=None)
+        with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:") as tar:
+            assert tar.extractfile("file1.txt").read() == b"content1"
+
     def test_download_files_nonexistent_sandbox(self):
         """Test downloading from non-existent sandbox."""
         with pytest.raises(ValueError, match="does not exist"):
@@ -245,6 +401,31 @@ class TestLocalBackend:
         assert not sandbox_path.exists()
         assert self.session_id not in self.backend._sandboxes
 
+    def test_delete_sandbox_invalidates_sanitizer_cache(self):
+        """Test that deleting a sandbox drops its cached resolution."""
+        self.backend.create_sandbox(self.session_id)
+        sandbox_path = self.backend._get_sandbox_path(self.session_id)
+        self.backend.sanitizer.ensure_within_sandbox(sandbox_path / "workspace", sandbox_path)
+        assert any(key[0] == sandbox_path for key in self.backend.sanitizer._resolved_cache)
+
+        self.backend.delete_sandbox(self.session_id)
+        assert not any(key[0] == sandbox_path for key in self.backend.sanitizer._resolved_cache)
+
+    def test_delete_sandbox_removes_in_background(self):
+        """Test that a deleted sandbox is staged and removed by close()."""
+        self.backend.upload_files(self.session_id, {f"dir/f{i}.txt": "x" for i in range(50)})
+        sandbox_path = self.backend._get_sandbox_path(self.session_id)
+
+        assert self.backend.delete_sandbox(self.session_id) is True
+        assert not sandbox_path.exists()
+
+        # The same session can be recreated right away
+        self.backend.create_sandbox(self.session_id)
+        assert (sandbox_path / "workspace").is_dir()
+
+        self.backend.close()
+        assert list((self.backend.base_dir / "noxrunner_gc").iterdir()) == []
+
     def test_delete_nonexistent_sandbox(self):
         """Test deleting non-existent sandbox."""
         result = self.backend.delete_sandbox("nonexistent-session")
@@ -258,6 +439,12 @@ class TestLocalBackend:
         # Verify sandbox was created
         assert self.session_id in self.backend._sandboxes
 
+    def test_wait_for_pod_ready_async(self):
+        """Test asynchronously waiting for pod ready."""
+        result = asyncio.run(self.backend.wait_for_pod_ready_async(self.session_id))
+        assert result is True
+        assert self.session_id in self.backend._sandboxes
+
     def test_path_sanitization(self):
         """Test path sanitization prevents traversal."""
         self.backend.create_sandbox(self.session_id)
@@ -292,3 +479,10 @@ class TestLocalBackend:
         # Session ID sanitization removes special chars, so "passwd" might remain
         # But path should be safe (in base_dir, not /etc)
         assert str(sandbox_path).startswith(str(self.test_base))
+
+        # Only alphanumerics, "-" and "_" are kept; an empty result maps to "default"
+        assert sandbox_path.name == "noxrunner_sandbox_etcpasswd"
+        assert self.backend._get_sandbox_path("a b/c-d_e").name == "noxrunner_sandbox_abc-d_e"
+        assert self.backend._get_sandbox_path("../..").name == "noxrunner_sandbox_default"
+        # Non-ASCII IDs keep their (Unicode) alphanumerics
+        assert self.backend._get_sandbox_path("café/1").name == "noxrunner_sandbox_café1"
@@ -4,9 +4,15 @@ Tests for file operations modules.
 Tests for tar handling.
 """
 
+import io
+import os
+import tarfile
 import tempfile
+import time
 from pathlib import Path
 
+import pytest
+
 from noxrunner.fileops.tar_handler import TarHandler
 
 
@@ -39,6 +45,54 @@ class TestTarHandler:
             assert "test2.txt" in members
             assert "subdir/test3.txt" in members
 
+    def test_create_tar_uncompressed_by_default(self):
+        """Test that create_tar produces a plain (uncompressed) tar archive."""
+        tar_data = self.tar_handler.create_tar({"test.txt": "Hello"})
+
+        with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:") as tar:
+            assert tar.getnames() == ["test.txt"]
+
+    def test_create_tar_sets_mtime(self):
+        """Test that archive members carry the creation time, not the epoch."""
+        before = int(time.time())
+        tar_data = self.tar_handler.create_tar({"a.txt": "A", "b.txt": "B"})
+
+        with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:") as tar:
+            mtimes = [member.mtime for member in tar.getmembers()]
+        assert mtimes[0] >= before
+        assert mtimes[0] == mtimes[1]
+
+    def test_create_tar_gzip(self):
+        """Test creating a gzip-compressed tar archive."""
+        tar_data = self.tar_handler.create_tar({"test.txt": "Hello"}, compression="gzip")
+
+        assert tar_data[:2] == b"\x1f\x8b"  # gzip magic number
+        with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+            assert tar.getnames() == ["test.txt"]
+
+    def test_write_tar_to_stream(self):
+        """Test streaming a tar archive into a write-only file object."""
+
+        class WriteOnly:
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, data):
+                self.chunks.append(bytes(data))
+                return len(data)
+
+        out = WriteOnly()
+        self.tar_handler.write_tar({"a.txt": "A", "b.bin": b"B" * 100000}, out)
+
+        with tarfile.open(fileobj=io.BytesIO(b"".join(out.chunks)), mode="r:") as tar:
+            assert tar.getnames() == ["a.txt", "b.bin"]
+            assert tar.extractfile("b.bin").read() == b"B" * 100000
+
+    def test_create_tar_unsupported_compression(self):
+        """Test that an unknown compression is rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            self.tar_handler.create_tar({"test.txt": "Hello"}, compression="lzma")
+
     def test_create_tar_from_directory(self):
         """Test creating tar archive from directory."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -53,6 +107,66 @@ class TestTarHandler:
             tar_data = self.tar_handler.create_tar_from_directory(tmp_path, tmp_path)
             assert len(tar_data) > 0
 
+    def test_create_tar_from_directory_members(self):
+        """Test member names, contents and modes from a directory archive."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "a" / "b").mkdir(parents=True)
+            (tmp_path / "a" / "b" / "deep.txt").write_text("deep")
+            (tmp_path / "run.sh").write_text("#!/bin/sh\n")
+            os.chmod(tmp_path / "run.sh", 0o755)
+
+            tar_data = self.tar_handler.create_tar_from_directory(tmp_path / "a", tmp_path)
+
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+                assert tar.getnames() == ["a/b/deep.txt"]
+                assert tar.extractfile("a/b/deep.txt").read() == b"deep"
+
+            tar_data = self.tar_handler.create_tar_from_directory(tmp_path, tmp_path)
+
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+                assert sorted(tar.getnames()) == ["a/b/deep.txt", "run.sh"]
+                assert tar.getmember("run.sh").mode == 0o755
+
+    def test_create_tar_from_single_file_or_missing_path(self):
+        """Test archiving a single file, and a path that does not exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "only.txt").write_text("only")
+
+            tar_data = self.tar_handler.create_tar_from_directory(tmp_path / "only.txt", tmp_path)
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+                assert tar.getnames() == ["only.txt"]
+
+            tar_data = self.tar_handler.create_tar_from_directory(tmp_path / "missing", tmp_path)
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+                assert tar.getnames() == []
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_create_tar_from_directory_symlinks(self):
+        """Test that symlinks are archived as links and not followed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / "target.txt").write_text("target")
+            (tmp_path / "dir").mkdir()
+            (tmp_path / "dir" / "inner.txt").write_text("inner")
+            os.symlink("target.txt", tmp_path / "link.txt")
+            os.symlink("dir", tmp_path / "dirlink")
+
+            tar_data = self.tar_handler.create_tar_from_directory(tmp_path, tmp_path)
+
+            with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r:gz") as tar:
+                assert sorted(tar.getnames()) == [
+                    "dir/inner.txt",
+                    "dirlink",
+                    "link.txt",
+                    "target.txt",
+                ]
+                link = tar.getmember("link.txt")
+                assert link.issym()
+                assert link.linkname == "target.txt"
+                assert tar.getmember("dirlink").issym()
+
     def test_extract_tar(self):
         """Test extracting tar archive."""
         # Create tar archive
@@ -73,6 +187,57 @@ class TestTarHandler:
             assert (dest / "test1.txt").read_text() == "Hello, World!"
             assert (dest / "test2.txt").read_text() == "Another file"
 
+    def test_extract_tar_gzip_nested(self):
+        """Test extracting a gzip archive with nested paths."""
+        tar_data = self.tar_handler.create_tar(
+            {"a.txt": "A", "sub/dir/b.txt": "B", "sub/c.bin": b"\x00" * 70000},
+            compression="gzip",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir)
+            file_count = self.tar_handler.extract_tar(tar_data, dest)
+
+            assert file_count == 3
+            assert (dest / "sub" / "dir" / "b.txt").read_text() == "B"
+            assert (dest / "sub" / "c.bin").read_bytes() == b"\x00" * 70000
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview, io.BytesIO])
+    def test_extract_tar_buffer_and_file_object(self, wrap):
+        """Test extracting from bytes-like buffers and file objects."""
+        tar_data = self.tar_handler.create_tar(
+            {"a.txt": "A", "sub/b.bin": b"\x01" * 30000}, compression="gzip"
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir)
+            file_count = self.tar_handler.extract_tar(wrap(tar_data), dest)
+
+            assert file_count == 2
+            assert (dest / "a.txt").read_text() == "A"
+            assert (dest / "sub" / "b.bin").read_bytes() == b"\x01" * 30000
+
+    def test_extract_tar_large_file_overwrites(self):
+        """Test extracting a multi-block file over a larger existing file."""
+        content = bytes(range(256)) * 5000
+        tar_data = self.tar_handler.create_tar({"big.bin": content, "small.txt": "new"})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir)
+            (dest / "small.txt").write_text("old content that is longer")
+            self.tar_handler.extract_tar(tar_data, dest)
+
+            assert (dest / "big.bin").read_bytes() == content
+            assert (dest / "small.txt").read_text() == "new"
+
+    def test_extract_truncated_tar(self):
+        """Test that a truncated archive is reported instead of written short."""
+        tar_data = self.tar_handler.create_tar({"big.bin": b"x" * 100000})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(tarfile.ReadError):
+                self.tar_handler.extract_tar(tar_data[:50000], Path(tmpdir))
+
     def test_extract_tar_with_security_check(self):
         """Test extracting tar archive with security checks."""
         # Create tar archive with potentially dangerous paths
@@ -99,6 +264,71 @@ class TestTarHandler:
             assert not (dest / "absolute.txt").exists()
             assert not (dest / "passwd").exists()
 
+    def test_extract_tar_dots_in_names(self):
+        """Test that '..' is only rejected as a path component."""
+        files = {
+            "file..txt": "Dots in name",
+            "dir..name/nested.txt": "Dots in directory",
+            "sub/../../escape.txt": "Traversal",
+            "..\\windows.txt": "Backslash traversal",
+        }
+        tar_data = self.tar_handler.create_tar(files)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir) / "dest"
+            file_count = self.tar_handler.extract_tar(tar_data, dest)
+
+            assert file_count == 2
+            assert (dest / "file..txt").read_text() == "Dots in name"
+            assert (dest / "dir..name" / "nested.txt").read_text() == "Dots in directory"
+            assert not (Path(tmpdir) / "escape.txt").exists()
+
+    @pytest.mark.parametrize("data_filter", [True, False])
+    def test_extract_tar_through_symlink(self, data_filter, monkeypatch):
+        """Test that members are never written through symlinks out of dest."""
+        if not data_filter:
+            monkeypatch.delattr(tarfile, "data_filter", raising=False)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dest = Path(tmpdir) / "dest"
+            outside = Path(tmpdir) / "outside"
+            dest.mkdir()
+            outside.mkdir()
+            # A link already present in the destination
+            (dest / "existing").symlink_to(outside)
+
+            buffer = io.BytesIO()
+            with tarfile.open(fileobj=buffer, mode="w") as tar:
+                link = tarfile.TarInfo("link")
+                link.type = tarfile.SYMTYPE
+                link.linkname = str(outside)
+                tar.addfile(link)
+                for name in ("link/evil.txt", "existing/evil2.txt"):
+                    info = tarfile.TarInfo(name)
+                    info.size = 4
+                    tar.addfile(info, io.BytesIO(b"evil"))
+
+            try:
+                self.tar_handler.extract_tar(buffer.getvalue(), dest)
+            except tarfile.TarError:
+                pass  # The data filter rejects the archive outright
+
+            assert list(outside.iterdir()) == []
+
+    def test_extract_tar_outside_sandbox(self):
+        """Test that nothing is extracted when dest lies outside sandbox_path."""
+        tar_data = self.tar_handler.create_tar({"normal.txt": "Normal file"})
+
+        with tempfile.TemporaryDirectory() as base:
+            sandbox_path = Path(base) / "sandbox"
+            sandbox_path.mkdir()
+            dest = Path(base) / "elsewhere"
+
+            file_count = self.tar_handler.extract_tar(tar_data, dest, sandbox_path=sandbox_path)
+
+            assert file_count == 0
+            assert not (dest / "normal.txt").exists()
+
     def test_extract_empty_tar(self):
         """Test extracting empty tar archive."""
         tar_data = b""
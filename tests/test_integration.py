@@ -42,6 +42,7 @@ class TestLocalBackendIntegration:
             self.backend.delete_sandbox(self.session_id)
         except Exception:
             pass
+        self.backend.close()
         if os.path.exists(self.test_base):
             shutil.rmtree(self.test_base)
 
@@ -260,6 +261,7 @@ class TestNoxRunnerClientIntegration:
         # Delete sandbox
         result = client.delete_sandbox(self.session_id)
         assert result is True
+        client.close()
 
     @pytest.mark.integration
     def test_client_http_mode(self):
@@ -8,6 +8,7 @@ They are designed to be safe by only operating within /tmp directories.
 import os
 import shutil
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -30,6 +31,7 @@ class TestLocalBackend:
         # Clean up sandbox
         if self.session_id in self.backend._sandboxes:
             self.backend.delete_sandbox(self.session_id)
+        self.backend.close()
         # Clean up test directory
         if os.path.exists(self.test_base):
             shutil.rmtree(self.test_base)
@@ -463,6 +465,7 @@ class TestNoxRunnerClientLocalMode:
             self.client.delete_sandbox(self.session_id)
         except Exception:
             pass
+        self.client.close()
         # Clean up test directory
         if os.path.exists(self.test_base):
             shutil.rmtree(self.test_base)
@@ -494,6 +497,25 @@ class TestNoxRunnerClientLocalMode:
         assert result["exitCode"] == 0
         assert "test" in result["stdout"]
 
+    def test_client_exec_async(self, capsys):
+        """Test executing command asynchronously via client."""
+        import asyncio
+
+        self.client.create_sandbox(self.session_id)
+
+        result = asyncio.run(self.client.exec_async(self.session_id, ["echo", "test"]))
+
+        assert result["exitCode"] == 0
+        assert result["stdout"] == "test\n"
+
+    def test_client_exec_stream(self, capsys):
+        """Test streaming command output via client."""
+        self.client.create_sandbox(self.session_id)
+
+        events = list(self.client.exec(self.session_id, ["echo", "test"], stream=True))
+
+        assert events == [("stdout", b"test\n"), ("exit", b"0")]
+
     def test_client_upload_download(self):
         """Test upload and download via client."""
         self.client.create_sandbox(self.session_id)
@@ -515,6 +537,46 @@ class TestNoxRunnerClientLocalMode:
             names = tar.getnames()
             assert any("test.txt" in name for name in names)
 
+    def test_client_upload_files_from_dir(self):
+        """Test uploading a local directory via client."""
+        self.client.create_sandbox(self.session_id)
+
+        local_dir = os.path.join(self.test_base, "project")
+        os.makedirs(os.path.join(local_dir, "src"))
+        with open(os.path.join(local_dir, "main.py"), "w") as f:
+            f.write("print('main')")
+        with open(os.path.join(local_dir, "src", "util.py"), "w") as f:
+            f.write("print('util')")
+
+        assert self.client.upload_files_from_dir(self.session_id, local_dir) is True
+
+        result = self.client.exec(self.session_id, ["cat", "src/util.py"])
+        assert result["stdout"] == "print('util')"
+
+    def test_client_upload_files_from_dir_symlink(self):
+        """Test that symlinked files in an uploaded directory are sent by content."""
+        self.client.create_sandbox(self.session_id)
+
+        target = os.path.join(self.test_base, "target.txt")
+        with open(target, "w") as f:
+            f.write("linked")
+        local_dir = os.path.join(self.test_base, "project")
+        os.makedirs(local_dir)
+        os.symlink(target, os.path.join(local_dir, "link.txt"))
+
+        assert self.client.upload_files_from_dir(self.session_id, local_dir) is True
+
+        workspace = self.client._backend._get_sandbox_path(self.session_id) / "workspace"
+        assert not (workspace / "link.txt").is_symlink()
+        assert (workspace / "link.txt").read_text() == "linked"
+
+    def test_client_upload_files_from_dir_not_a_directory(self):
+        """Test uploading a path that is not a directory."""
+        with pytest.raises(ValueError):
+            self.client.upload_files_from_dir(
+                self.session_id, os.path.join(self.test_base, "missing")
+            )
+
     def test_client_touch(self):
         """Test touch via client."""
         self.client.create_sandbox(self.session_id)
@@ -529,6 +591,27 @@ class TestNoxRunnerClientLocalMode:
         """Test health check via client."""
         assert self.client.health_check() is True
 
+    def test_client_health_check_cached(self):
+        """Test that health check results are cached for health_ttl seconds."""
+        with patch.object(
+            self.client._backend, "health_check", return_value=True
+        ) as mock_health_check:
+            assert self.client.health_check() is True
+            assert self.client.health_check() is True
+            assert mock_health_check.call_count == 1
+
+            # force bypasses the cache
+            assert self.client.health_check(force=True) is True
+            assert mock_health_check.call_count == 2
+
+    def test_client_health_check_cache_disabled(self):
+        """Test that health_ttl=0 disables health check caching."""
+        client = NoxRunnerClient(local_test=True, health_ttl=0)
+        with patch.object(client._backend, "health_check", return_value=True) as mock_health_check:
+            client.health_check()
+            client.health_check()
+            assert mock_health_check.call_count == 2
+
     def test_client_wait_for_pod_ready(self):
         """Test wait for pod ready via client."""
         assert self.client.wait_for_pod_ready(self.session_id) is True
@@ -761,6 +844,7 @@ class TestLocalSandboxSecurity:
             self.backend.delete_sandbox(self.session_id)
         except Exception:
             pass
+        self.backend.close()
         if os.path.exists(self.test_base):
             shutil.rmtree(self.test_base)
 
@@ -5,6 +5,7 @@ Tests for command validation and path sanitization.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 from noxrunner.security.command_validator import CommandValidator
 from noxrunner.security.path_sanitizer import PathSanitizer
@@ -33,6 +34,11 @@ class TestCommandValidator:
         assert self.validator.validate(["sudo", "rm", "-rf", "/"]) is False
         assert self.validator.validate(["shutdown", "-h", "now"]) is False
 
+    def test_validate_unlisted_command(self):
+        """Test that commands not on the allowlist are rejected."""
+        assert self.validator.validate(["curl", "http://example.com"]) is False
+        assert self.validator.validate(["nonexistent_command_xyz"]) is False
+
     def test_is_allowed(self):
         """Test is_allowed method."""
         assert self.validator.is_allowed("echo") is True
@@ -49,6 +55,9 @@ class TestCommandValidator:
         """Test that validation is case insensitive."""
         assert self.validator.validate(["ECHO", "hello"]) is True
         assert self.validator.validate(["RM", "-rf", "/"]) is False
+        assert self.validator.validate(["Sudo", "ls"]) is False
+        assert self.validator.is_blocked("ChMod") is True
+        assert self.validator.is_blocked("[") is False
 
 
 class TestPathSanitizer:
@@ -116,6 +125,77 @@ class TestPathSanitizer:
         assert result1 == expected
         assert result2 == expected
 
+    def test_sanitize_dots_in_names(self):
+        """Test that only all-dot components count as traversal."""
+        sandbox_path = self.temp_dir / "sandbox"
+        sandbox_path.mkdir()
+        workspace = sandbox_path.resolve() / "workspace"
+
+        assert (
+            self.sanitizer.sanitize("v1..2/file.txt", sandbox_path)
+            == workspace / "v1..2" / "file.txt"
+        )
+        assert self.sanitizer.sanitize("a/.../b", sandbox_path) == workspace
+        assert self.sanitizer.sanitize("a\\..\\b", sandbox_path) == workspace
+
+        assert self.sanitizer.has_traversal("a/../b")
+        assert self.sanitizer.has_traversal("....")
+        assert not self.sanitizer.has_traversal("./a/b..c")
+
+    def test_sanitize_workspace_root(self):
+        """Test that the workspace root sanitizes to the workspace directory."""
+        sandbox_path = self.temp_dir / "sandbox"
+        sandbox_path.mkdir()
+
+        expected = sandbox_path.resolve() / "workspace"
+        assert self.sanitizer.sanitize("/workspace", sandbox_path) == expected
+        assert self.sanitizer.sanitize("", sandbox_path) == expected
+
+    def test_sandbox_resolution_cached(self):
+        """Test that the sandbox path is resolved once until invalidated."""
+        sandbox_path = self.temp_dir / "sandbox"
+        sandbox_path.mkdir()
+        original_resolve = Path.resolve
+
+        with patch.object(Path, "resolve", autospec=True, side_effect=original_resolve) as resolve:
+            self.sanitizer.sanitize("a.txt", sandbox_path)
+            self.sanitizer.sanitize("b.txt", sandbox_path)
+            self.sanitizer.sanitize("/workspace", sandbox_path)
+            sandbox_resolves = [c for c in resolve.call_args_list if c[0][0] == sandbox_path]
+            assert len(sandbox_resolves) == 1
+
+            self.sanitizer.invalidate(sandbox_path)
+            self.sanitizer.sanitize("a.txt", sandbox_path)
+            sandbox_resolves = [c for c in resolve.call_args_list if c[0][0] == sandbox_path]
+            assert len(sandbox_resolves) == 2
+
+    def test_sanitize_with_presolved_sandbox(self):
+        """Test that a caller-supplied resolved sandbox path is used as-is."""
+        sandbox_path = self.temp_dir / "sandbox"
+        sandbox_path.mkdir()
+        resolved = sandbox_path.resolve()
+        original_resolve = Path.resolve
+
+        with patch.object(Path, "resolve", autospec=True, side_effect=original_resolve) as resolve:
+            result = self.sanitizer.sanitize("/workspace", sandbox_path, sandbox_resolved=resolved)
+            assert result == resolved / "workspace"
+            assert not [c for c in resolve.call_args_list if c[0][0] == sandbox_path]
+
+    def test_sanitize_plain_filename_symlink_escape(self):
+        """Test that a plain file name symlinked outside the sandbox is redirected."""
+        sandbox_path = self.temp_dir / "sandbox"
+        workspace = sandbox_path / "workspace"
+        workspace.mkdir(parents=True)
+        outside = self.temp_dir / "outside.txt"
+        outside.write_text("secret")
+        (workspace / "link.txt").symlink_to(outside)
+
+        assert (
+            self.sanitizer.sanitize("link.txt", sandbox_path)
+            == sandbox_path.resolve() / "workspace"
+        )
+        assert self.sanitizer.sanitize("...", sandbox_path) == sandbox_path.resolve() / "workspace"
+
     def test_sanitize_filename(self):
         """Test sanitizing filename."""
         assert self.sanitizer.sanitize_filename("test.txt") == "test.txt"
@@ -133,3 +213,7 @@ class TestPathSanitizer:
         assert (
             self.sanitizer.ensure_within_sandbox(self.temp_dir / "outside", sandbox_path) is False
         )
+
+        # A symlink out of the sandbox is still caught
+        (workspace / "escape").symlink_to(self.temp_dir)
+        assert self.sanitizer.ensure_within_sandbox(workspace / "escape", sandbox_path) is False